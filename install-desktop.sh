@@ -26,6 +26,10 @@ EOF
 
 chmod +x "$DESKTOP_FILE"
 
+# Precompile bytecode (translations in src/i18n are large dict literals)
+"$SCRIPT_DIR/venv/bin/python" -m compileall -q "$SCRIPT_DIR/src" 2>/dev/null || \
+    python3 -m compileall -q "$SCRIPT_DIR/src" 2>/dev/null || true
+
 # Update desktop database
 update-desktop-database "$HOME/.local/share/applications/" 2>/dev/null || true
 
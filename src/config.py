@@ -1,7 +1,10 @@
 """
 Claude Voice Assistant - Configuration
 """
+import importlib
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Application Info
@@ -14,15 +17,25 @@ BASE_DIR = Path(__file__).parent.parent
 SRC_DIR = BASE_DIR / "src"
 ASSETS_DIR = SRC_DIR / "assets"
 I18N_DIR = SRC_DIR / "i18n"
-CONFIG_DIR = Path.home() / ".claude-voice-assistant"
+HOME_DIR = Path.home()
+CONFIG_DIR = HOME_DIR / ".claude-voice-assistant"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 QUICK_ACTIONS_FILE = CONFIG_DIR / "quick_actions.json"
 LICENSE_FILE = CONFIG_DIR / "license.key"
 AGENTS_FILE = CONFIG_DIR / "agents.json"
 MEMORY_PROJECTS_FILE = CONFIG_DIR / "memory_projects.json"
 
-# Ensure config directory exists
-CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+# Config directory is created on first write, not at import
+_dir_ensured = False
+
+
+def ensure_config_dir():
+    """Create the config directory (at most once per process)."""
+    global _dir_ensured
+    if not _dir_ensured:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        _dir_ensured = True
+
 
 # License Server (will be changed to custom domain later)
 LICENSE_SERVER_URL = "https://license.srv1251441.hstgr.cloud/api"
@@ -68,93 +81,83 @@ SUPPORTED_LANGUAGES = {
     "en-GB": ("English (UK)", "English (UK)", "en-GB-SoniaNeural"),
 }
 
+# Direct lookups between language codes and TTS voices
+LANG_TO_VOICE = {code: voice for code, (_, _, voice) in SUPPORTED_LANGUAGES.items()}
+VOICE_TO_LANG = {voice: code for code, (_, _, voice) in SUPPORTED_LANGUAGES.items()}
+
 # UI Translations
-UI_TRANSLATIONS = {
-    "pl-PL": {
-        "app_title": "Claude Voice Assistant",
-        "dictate": "Dyktuj",
-        "read": "Czytaj",
-        "copy": "Kopiuj",
-        "clear_input": "Wyczyść pole",
-        "add_media": "Dodaj media",
-        "pause": "Pauza",
-        "resume": "Wznów",
-        "stop": "Stop",
-        "send": "Wyślij",
-        "auto_read": "Auto-czytaj odpowiedzi",
-        "quick_actions": "Szybkie akcje",
-        "add_action": "Dodaj własną...",
-        "settings": "Ustawienia",
-        "language": "Język",
-        "voice": "Głos",
-        "speed": "Szybkość",
-        "recording": "Nagrywanie...",
-        "processing": "Przetwarzanie...",
-        "reading": "Czytam...",
-        "paused": "Wstrzymano",
-        "trial_days_left": "Pozostało dni próbnych",
-        "buy_license": "Kup licencję",
-        "enter_license": "Wprowadź klucz licencji",
-        "license_valid": "Licencja aktywna",
-        "license_expired": "Licencja wygasła",
-    },
-    "en-US": {
-        "app_title": "Claude Voice Assistant",
-        "dictate": "Dictate",
-        "read": "Read",
-        "copy": "Copy",
-        "clear_input": "Clear input",
-        "add_media": "Add media",
-        "pause": "Pause",
-        "resume": "Resume",
-        "stop": "Stop",
-        "send": "Send",
-        "auto_read": "Auto-read responses",
-        "quick_actions": "Quick Actions",
-        "add_action": "Add custom...",
-        "settings": "Settings",
-        "language": "Language",
-        "voice": "Voice",
-        "speed": "Speed",
-        "recording": "Recording...",
-        "processing": "Processing...",
-        "reading": "Reading...",
-        "paused": "Paused",
-        "trial_days_left": "Trial days left",
-        "buy_license": "Buy license",
-        "enter_license": "Enter license key",
-        "license_valid": "License active",
-        "license_expired": "License expired",
-    },
-    "en-GB": {
-        "app_title": "Claude Voice Assistant",
-        "dictate": "Dictate",
-        "read": "Read",
-        "copy": "Copy",
-        "clear_input": "Clear input",
-        "add_media": "Add media",
-        "pause": "Pause",
-        "resume": "Resume",
-        "stop": "Stop",
-        "send": "Send",
-        "auto_read": "Auto-read responses",
-        "quick_actions": "Quick Actions",
-        "add_action": "Add custom...",
-        "settings": "Settings",
-        "language": "Language",
-        "voice": "Voice",
-        "speed": "Speed",
-        "recording": "Recording...",
-        "processing": "Processing...",
-        "reading": "Reading...",
-        "paused": "Paused",
-        "trial_days_left": "Trial days left",
-        "buy_license": "Buy licence",
-        "enter_license": "Enter licence key",
-        "license_valid": "Licence active",
-        "license_expired": "Licence expired",
-    },
-}
+# Each locale lives in src/i18n/<code>.py (e.g. pl_PL.py) and is imported
+# only when first looked up, so unused locales cost nothing at startup.
+UI_LOCALES = ("pl-PL", "en-US", "en-GB")
+
+
+@lru_cache(maxsize=None)
+def load_ui_translation(code: str) -> dict:
+    """Import the translation dict for a single locale."""
+    module = importlib.import_module(f"i18n.{code.replace('-', '_')}")
+    # Intern keys and values so strings repeated across locales are shared
+    return {sys.intern(k): sys.intern(v) for k, v in module.TRANSLATIONS.items()}
+
+
+class _LazyTranslations(dict):
+    """Dict of locale code -> translations, materialized on first access."""
+
+    def __init__(self, codes):
+        super().__init__()
+        self._codes = tuple(codes)
+
+    def __missing__(self, code: str) -> dict:
+        if code not in self._codes:
+            raise KeyError(code)
+        translations = load_ui_translation(code)
+        dict.__setitem__(self, code, translations)
+        return translations
+
+    def __contains__(self, code) -> bool:
+        return code in self._codes
+
+    def __iter__(self):
+        return iter(self._codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def get(self, code, default=None):
+        return self[code] if code in self._codes else default
+
+    def keys(self):
+        return list(self._codes)
+
+    def items(self):
+        return [(code, self[code]) for code in self._codes]
+
+    def values(self):
+        return [self[code] for code in self._codes]
+
+
+UI_TRANSLATIONS = _LazyTranslations(UI_LOCALES)
+
+# Flat (lang, key) -> text cache filled by tr()
+_FLAT_TR: dict = {}
+
+
+def tr(lang: str, key: str) -> str:
+    """Get translated UI text, falling back to English, then Polish, then the key."""
+    try:
+        return _FLAT_TR[(lang, key)]
+    except KeyError:
+        pass
+
+    text = key
+    for code in (lang, "en-US", "pl-PL"):
+        translations = UI_TRANSLATIONS.get(code)
+        if translations and key in translations:
+            text = translations[key]
+            break
+
+    _FLAT_TR[(lang, key)] = text
+    return text
+
 
 # Default Agents Configuration
 DEFAULT_AGENTS = [
@@ -163,7 +166,7 @@ DEFAULT_AGENTS = [
         "name": "Główny",
         "auto_start": True,
         "memory_files": [],  # list of file paths to load as context
-        "working_directory": str(Path.home()),
+        "working_directory": str(HOME_DIR),
         "splitter_sizes": [600, 150],  # [terminal_height, bottom_panel_height]
     }
 ]
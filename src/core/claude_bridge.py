@@ -2,8 +2,12 @@
 Claude Voice Assistant - Claude Code Bridge
 Handles communication with Claude Code CLI using --print mode.
 """
+import atexit
+import codecs
+import json
 import os
-import re
+import selectors
+import shutil
 import subprocess
 import threading
 import time
@@ -11,15 +15,33 @@ from typing import Callable, Optional
 from queue import Queue
 from pathlib import Path
 
-# Debug log file
+# Debug log file (only written when CVA_DEBUG is set)
 DEBUG_LOG = Path.home() / ".claude-voice-assistant" / "debug.log"
+DEBUG = bool(os.getenv("CVA_DEBUG"))
+
+# Cached result of `claude --version` (path, mtime, version)
+PROBE_FILE = Path.home() / ".claude-voice-assistant" / "claude_probe.json"
+
+# Pipe read size for Claude output
+READ_CHUNK_SIZE = 65536
+
+# Debug log handle, opened once for the whole process
+_DEBUG_FH = None
+if DEBUG:
+    try:
+        DEBUG_LOG.parent.mkdir(parents=True, exist_ok=True)
+        _DEBUG_FH = open(DEBUG_LOG, 'a', buffering=8192)
+        atexit.register(_DEBUG_FH.close)
+    except OSError:
+        _DEBUG_FH = None
 
 def debug_log(msg: str):
     """Write debug message to log file."""
+    if _DEBUG_FH is None:
+        return
     try:
-        with open(DEBUG_LOG, 'a') as f:
-            f.write(f"[{time.strftime('%H:%M:%S')}] {msg}\n")
-    except:
+        _DEBUG_FH.write(f"[{time.strftime('%H:%M:%S')}] {msg}\n")
+    except OSError:
         pass
 
 
@@ -41,15 +63,16 @@ class ClaudeBridge:
 
     def start(self) -> bool:
         """Initialize the bridge (check if claude command exists)."""
+        # Skip the version check if the binary is unchanged since last probe
+        probe = self._cached_probe()
+        if probe:
+            debug_log(f"Claude version (cached): {probe.get('version', '')}")
+            self.running = True
+            threading.Thread(target=self._refresh_probe, daemon=True).start()
+            return True
+
         try:
-            # Check if command exists
-            result = subprocess.run(
-                [self.command, '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            debug_log(f"Claude version: {result.stdout.strip()}")
+            self._probe_version()
             self.running = True
             return True
 
@@ -62,13 +85,63 @@ class ClaudeBridge:
                 self.on_error(f"Failed to start Claude Code: {str(e)}")
             return False
 
+    def _cached_probe(self) -> Optional[dict]:
+        """Return the saved probe if it matches the current claude binary."""
+        path = shutil.which(self.command)
+        if not path:
+            return None
+        try:
+            with open(PROBE_FILE, 'r') as f:
+                probe = json.load(f)
+            if probe.get('path') == path and probe.get('mtime') == os.stat(path).st_mtime:
+                return probe
+        except Exception:
+            pass
+        return None
+
+    def _refresh_probe(self):
+        """Re-run the version probe in the background after a cached start."""
+        try:
+            self._probe_version()
+        except Exception as e:
+            debug_log(f"Background version probe failed: {e}")
+
+    def _probe_version(self):
+        """Run `claude --version` and save the result for the next start."""
+        # Check if command exists
+        result = subprocess.run(
+            [self.command, '--version'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        version = result.stdout.strip()
+        debug_log(f"Claude version: {version}")
+
+        # Only cache a probe that actually succeeded
+        if result.returncode != 0 or not version:
+            return
+        path = shutil.which(self.command)
+        if not path:
+            return
+        try:
+            PROBE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(PROBE_FILE, 'w') as f:
+                json.dump({
+                    'path': path,
+                    'mtime': os.stat(path).st_mtime,
+                    'version': version,
+                }, f)
+        except OSError:
+            pass
+
     def stop(self):
         """Stop any running process."""
         self.running = False
         if self.current_process:
             try:
                 self.current_process.terminate()
-            except:
+            except OSError:
                 pass
             self.current_process = None
 
@@ -93,27 +166,48 @@ class ClaudeBridge:
             if self.on_output:
                 self.on_output("⏳ Processing...\n")
 
-            # Run claude with --print flag
+            # Run claude with --print flag (unbuffered, decoded per chunk)
             self.current_process = subprocess.Popen(
                 [self.command, '--print', text],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                bufsize=0
             )
 
-            # Read output in real-time
-            response_text = ""
-            for line in self.current_process.stdout:
-                debug_log(f"Output line: {line[:100] if line else '(empty)'}")
-                response_text += line
-                if self.on_output:
-                    self.on_output(line)
+            # Drain stdout and stderr together so neither pipe can fill up and
+            # stall the process; stdout is streamed to on_output as it arrives
+            proc = self.current_process
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            response_parts = []
+            error_parts = []
+            with selectors.DefaultSelector() as selector:
+                selector.register(proc.stdout, selectors.EVENT_READ, response_parts)
+                selector.register(proc.stderr, selectors.EVENT_READ, error_parts)
+                while selector.get_map():
+                    for key, _ in selector.select(timeout=0.1):
+                        chunk = os.read(key.fd, READ_CHUNK_SIZE)
+                        if key.data is error_parts:
+                            if chunk:
+                                error_parts.append(chunk)
+                            else:
+                                selector.unregister(key.fileobj)
+                            continue
+
+                        text_chunk = decoder.decode(chunk, final=not chunk)
+                        if text_chunk:
+                            response_parts.append(text_chunk)
+                            if self.on_output:
+                                self.on_output(text_chunk)
+                        if not chunk:
+                            selector.unregister(key.fileobj)
+            response_text = ''.join(response_parts)
+            debug_log(f"Output: {len(response_text)} chars in {len(response_parts)} chunks")
 
             # Wait for completion
-            self.current_process.wait()
+            proc.wait()
 
             # Check for errors
-            stderr = self.current_process.stderr.read()
+            stderr = b''.join(error_parts).decode('utf-8', 'replace')
             if stderr:
                 debug_log(f"Stderr: {stderr}")
 
@@ -136,7 +230,7 @@ class ClaudeBridge:
             try:
                 self.current_process.terminate()
                 debug_log("Process terminated")
-            except:
+            except OSError:
                 pass
 
     def is_running(self) -> bool:
@@ -153,6 +247,7 @@ class ClaudeBridgeAsync:
     def __init__(self, command: str = "claude"):
         self.bridge = ClaudeBridge(command)
         self._output_callbacks = []
+        self._single_output: Optional[Callable[[str], None]] = None  # set while exactly one is connected
         self._response_callbacks = []
         self._error_callbacks = []
 
@@ -164,6 +259,7 @@ class ClaudeBridgeAsync:
     def connect_output(self, callback: Callable[[str], None]):
         """Connect callback for real-time output."""
         self._output_callbacks.append(callback)
+        self._single_output = callback if len(self._output_callbacks) == 1 else None
 
     def connect_response(self, callback: Callable[[str], None]):
         """Connect callback for complete responses."""
@@ -174,6 +270,14 @@ class ClaudeBridgeAsync:
         self._error_callbacks.append(callback)
 
     def _handle_output(self, text: str):
+        # Fast path: the GUI connects a single output slot
+        if self._single_output is not None:
+            try:
+                self._single_output(text)
+            except Exception as e:
+                debug_log(f"Error in output callback: {e}")
+            return
+
         for cb in self._output_callbacks:
             try:
                 cb(text)
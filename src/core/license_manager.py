@@ -7,12 +7,28 @@ import hashlib
 import platform
 import uuid
 import os
+import threading
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 from enum import Enum
 
-import requests
+# Try to use orjson for faster license/device file I/O
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode('utf-8')
 
 
 class LicenseStatus(Enum):
@@ -25,28 +41,49 @@ class LicenseStatus(Enum):
     OFFLINE = "offline"
 
 
+@lru_cache(maxsize=1)
+def _compute_device_hash(node: str, machine: str, processor: str, mac: str) -> str:
+    """Hash system info into a 32-char hex device identifier."""
+    combined = '|'.join((node, machine, processor, mac))
+    return hashlib.blake2b(combined.encode(), digest_size=16).hexdigest()
+
+
 class LicenseManager:
     """
     Manages application licensing with trial support.
     Communicates with license server for validation.
     """
 
+    # How long a server validation result is trusted before refreshing it
+    REVALIDATE_INTERVAL = timedelta(hours=1)
+
+    # Longest wait between retries while the server is unreachable (seconds)
+    MAX_RETRY_BACKOFF = 600
+
     def __init__(
         self,
         license_server_url: str = "https://license.srv1251441.hstgr.cloud/api",
         trial_days: int = 30,
-        config_dir: Optional[Path] = None
+        config_dir: Optional[Path] = None,
+        app_version: str = "1.0.0"
     ):
         self.server_url = license_server_url
+        self._url_trial = f"{license_server_url}/license/trial"
+        self._url_activate = f"{license_server_url}/license/activate"
+        self._url_validate = f"{license_server_url}/license/validate"
+        self._url_purchase_base = f"{license_server_url.replace('/api', '')}/purchase"
         self.trial_days = trial_days
+        self.app_version = app_version
+
+        # Shared HTTP session, created on first server call (see _get_session)
+        self._session = None
 
         # Config directory
         if config_dir:
             self.config_dir = config_dir
         else:
             self.config_dir = Path.home() / ".claude-voice-assistant"
-
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        self._config_dir_ensured = False
 
         self.license_file = self.config_dir / "license.json"
         self.device_file = self.config_dir / "device.json"
@@ -55,56 +92,88 @@ class LicenseManager:
         self._license_data: Dict[str, Any] = {}
         self._device_id: str = ""
         self._status = LicenseStatus.NO_LICENSE
+        self._last_validated_at: Optional[datetime] = None
+
+        # Parsed dates from _license_data, cleared whenever it is loaded/saved
+        self._trial_end_cache: Optional[datetime] = None
+        self._expiry_cache: Optional[datetime] = None
+
+        # Background revalidation state
+        self._lock = threading.Lock()
+        self._revalidating = False
+
+        # Exponential backoff while the server is unreachable
+        self._consecutive_failures = 0
+        self._next_retry_at: Optional[datetime] = None
 
         # Load existing data
         self._load_device_id()
         self._load_license()
 
     def _load_device_id(self):
-        """Load or generate device ID."""
+        """Load device ID, generating it only if no saved ID exists."""
         if self.device_file.exists():
             try:
-                with open(self.device_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.device_file, 'rb') as f:
+                    data = _loads(f.read())
                     self._device_id = data.get('device_id', '')
-            except:
+            except (OSError, ValueError):
                 pass
 
         if not self._device_id:
             self._device_id = self._generate_device_id()
             self._save_device_id()
 
+    def _ensure_config_dir(self):
+        """Create the config directory before the first write."""
+        if not self._config_dir_ensured:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            self._config_dir_ensured = True
+
     def _save_device_id(self):
         """Save device ID to file."""
-        with open(self.device_file, 'w') as f:
-            json.dump({'device_id': self._device_id}, f)
+        self._ensure_config_dir()
+        with open(self.device_file, 'wb') as f:
+            f.write(_dumps({'device_id': self._device_id}))
 
     def _generate_device_id(self) -> str:
         """Generate unique device identifier."""
         # Combine various system info for uniqueness
-        info = [
+        # (platform.processor() may spawn `uname`, so this runs once per install)
+        return _compute_device_hash(
             platform.node(),
             platform.machine(),
             platform.processor(),
             str(uuid.getnode()),  # MAC address
-        ]
+        )
 
-        combined = '|'.join(info)
-        return hashlib.sha256(combined.encode()).hexdigest()[:32]
+    def _invalidate_date_cache(self):
+        """Forget parsed trial/expiry dates after license data changes."""
+        self._trial_end_cache = None
+        self._expiry_cache = None
 
     def _load_license(self):
         """Load license data from file."""
+        self._invalidate_date_cache()
         if self.license_file.exists():
             try:
-                with open(self.license_file, 'r') as f:
-                    self._license_data = json.load(f)
-            except:
+                with open(self.license_file, 'rb') as f:
+                    self._license_data = _loads(f.read())
+            except (OSError, ValueError):
                 self._license_data = {}
 
+        last_validated = self._license_data.get('last_validated_at')
+        try:
+            self._last_validated_at = datetime.fromisoformat(last_validated) if last_validated else None
+        except ValueError:
+            self._last_validated_at = None
+
     def _save_license(self):
         """Save license data to file."""
-        with open(self.license_file, 'w') as f:
-            json.dump(self._license_data, f, indent=2, default=str)
+        self._invalidate_date_cache()
+        self._ensure_config_dir()
+        with open(self.license_file, 'wb') as f:
+            f.write(_dumps(self._license_data))
 
     def get_status(self) -> LicenseStatus:
         """Get current license status."""
@@ -123,29 +192,49 @@ class LicenseManager:
         if 'trial_start' not in self._license_data:
             return self.trial_days
 
-        trial_start = datetime.fromisoformat(self._license_data['trial_start'])
-        trial_end = trial_start + timedelta(days=self.trial_days)
-        remaining = (trial_end - datetime.now()).days
+        if self._trial_end_cache is None:
+            trial_start = datetime.fromisoformat(self._license_data['trial_start'])
+            self._trial_end_cache = trial_start + timedelta(days=self.trial_days)
+        remaining = (self._trial_end_cache - datetime.now()).days
 
         return max(0, remaining)
 
     def get_expiry_date(self) -> Optional[datetime]:
         """Get license expiry date."""
-        if 'expiry_date' in self._license_data:
-            return datetime.fromisoformat(self._license_data['expiry_date'])
-        return None
+        if self._expiry_cache is not None:
+            return self._expiry_cache
+        expiry_date = self._license_data.get('expiry_date')
+        if expiry_date:
+            self._expiry_cache = datetime.fromisoformat(expiry_date)
+        return self._expiry_cache
+
+    def _get_session(self):
+        """Get the shared HTTP session, importing requests on first use."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            # Keeps the TLS connection to the server alive between calls
+            self._session = requests.Session()
+            self._session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
+            self._session.headers.update({
+                'Content-Type': 'application/json',
+                'User-Agent': f'CVA/{self.app_version}'
+            })
+        return self._session
 
     def start_trial(self, email: str) -> bool:
         """Start trial period."""
+        import requests
         try:
             # Register with server
-            response = requests.post(
-                f"{self.server_url}/license/trial",
+            response = self._get_session().post(
+                self._url_trial,
                 json={
                     'email': email,
                     'device_id': self._device_id,
                     'platform': platform.system(),
-                    'app_version': '1.0.0'
+                    'app_version': self.app_version
                 },
                 timeout=10
             )
@@ -185,9 +274,10 @@ class LicenseManager:
 
     def activate_license(self, license_key: str) -> tuple[bool, str]:
         """Activate license with key."""
+        import requests
         try:
-            response = requests.post(
-                f"{self.server_url}/license/activate",
+            response = self._get_session().post(
+                self._url_activate,
                 json={
                     'license_key': license_key,
                     'device_id': self._device_id,
@@ -205,6 +295,7 @@ class LicenseManager:
                     'expiry_date': data.get('expiry_date'),
                     'activated_at': datetime.now().isoformat()
                 })
+                self._record_validation(LicenseStatus.VALID)
                 self._save_license()
                 self._status = LicenseStatus.VALID
                 return True, "Licencja aktywowana pomyślnie!"
@@ -235,22 +326,86 @@ class LicenseManager:
 
         # Check paid license
         if license_type in ['pro', 'lifetime']:
-            # Try to validate with server
+            cached = self._license_data.get('validated_status')
+            if not cached:
+                # Never validated - nothing to fall back on, ask the server now
+                return self._revalidate()
+
+            # Serve the last-known-good result, refresh in background if stale
             try:
-                response = requests.post(
-                    f"{self.server_url}/license/validate",
-                    json={
-                        'license_key': self._license_data.get('license_key', ''),
-                        'device_id': self._device_id
-                    },
-                    timeout=10
-                )
+                self._status = LicenseStatus(cached)
+            except ValueError:
+                return self._revalidate()
+
+            expiry = self.get_expiry_date()
+            if expiry and expiry < datetime.now():
+                self._status = LicenseStatus.EXPIRED
+
+            if self._validation_is_stale():
+                self._start_background_revalidate()
+
+            return self._status
+
+        self._status = LicenseStatus.NO_LICENSE
+        return self._status
+
+    def _validation_is_stale(self) -> bool:
+        """Check whether the cached server validation should be refreshed."""
+        if self._last_validated_at is None:
+            return True
+        return datetime.now() - self._last_validated_at >= self.REVALIDATE_INTERVAL
+
+    def _record_validation(self, status: LicenseStatus):
+        """Remember a server validation result in the license data."""
+        self._last_validated_at = datetime.now()
+        self._license_data['last_validated_at'] = self._last_validated_at.isoformat()
+        self._license_data['validated_status'] = status.value
+
+    def _start_background_revalidate(self):
+        """Spawn a revalidation thread unless one is already running."""
+        with self._lock:
+            if self._revalidating:
+                return
+            self._revalidating = True
+
+        threading.Thread(target=self._background_revalidate, daemon=True).start()
+
+    def _background_revalidate(self):
+        """Refresh license status from the server without blocking the caller."""
+        try:
+            self._revalidate()
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._revalidating = False
+
+    def _revalidate(self) -> LicenseStatus:
+        """Validate paid license with the server and update cached state."""
+        # Server recently unreachable - don't wait for another timeout yet
+        if self._next_retry_at and datetime.now() < self._next_retry_at:
+            return self._offline_status()
+
+        import requests
+        try:
+            response = self._get_session().post(
+                self._url_validate,
+                json={
+                    'license_key': self._license_data.get('license_key', ''),
+                    'device_id': self._device_id
+                },
+                timeout=10
+            )
+
+            with self._lock:
+                self._consecutive_failures = 0
+                self._next_retry_at = None
 
                 if response.status_code == 200:
                     data = response.json()
                     if data.get('valid'):
                         self._license_data['expiry_date'] = data.get('expiry_date')
-                        self._save_license()
+                        self._invalidate_date_cache()
 
                         # Check expiry
                         expiry = self.get_expiry_date()
@@ -260,26 +415,32 @@ class LicenseManager:
                             self._status = LicenseStatus.VALID
                     else:
                         self._status = LicenseStatus.INVALID
-                else:
-                    # Server error - use cached data
-                    self._status = LicenseStatus.OFFLINE
 
-            except requests.RequestException:
-                # Offline - use cached validation
-                expiry = self.get_expiry_date()
-                if expiry:
-                    if expiry < datetime.now():
-                        self._status = LicenseStatus.EXPIRED
-                    else:
-                        self._status = LicenseStatus.OFFLINE
-                else:
+                    self._record_validation(self._status)
+                    self._save_license()
+                elif not self._license_data.get('validated_status'):
+                    # Server error and nothing cached
                     self._status = LicenseStatus.OFFLINE
 
+                return self._status
+        except (requests.RequestException, ValueError, OSError):
+            # Unreachable server, malformed response body or unwritable license file
+            with self._lock:
+                self._consecutive_failures += 1
+                delay = min(self.MAX_RETRY_BACKOFF, 10 * 2 ** self._consecutive_failures)
+                self._next_retry_at = datetime.now() + timedelta(seconds=delay)
+            return self._offline_status()
+
+    def _offline_status(self) -> LicenseStatus:
+        """Status to report when the server can't be reached (cached validation)."""
+        expiry = self.get_expiry_date()
+        with self._lock:
+            if expiry and expiry < datetime.now():
+                self._status = LicenseStatus.EXPIRED
+            elif self._license_data.get('validated_status') != LicenseStatus.INVALID.value:
+                self._status = LicenseStatus.OFFLINE
             return self._status
 
-        self._status = LicenseStatus.NO_LICENSE
-        return self._status
-
     def can_use_app(self) -> bool:
         """Check if user can use the application."""
         status = self.validate()
@@ -292,11 +453,13 @@ class LicenseManager:
     def get_purchase_url(self) -> str:
         """Get URL for purchasing license."""
         email = self._license_data.get('email', '')
-        return f"{self.server_url.replace('/api', '')}/purchase?email={email}"
+        return f"{self._url_purchase_base}?email={email}"
 
     def clear_license(self):
         """Clear all license data (for testing)."""
         self._license_data = {}
+        self._last_validated_at = None
+        self._invalidate_date_cache()
         if self.license_file.exists():
             self.license_file.unlink()
         self._status = LicenseStatus.NO_LICENSE
@@ -2,11 +2,11 @@
 Claude Voice Assistant - Speech-to-Text Engine
 Uses Groq Whisper API for fast, accurate transcription.
 """
-import io
-import wave
-import tempfile
+import struct
 import threading
-import os
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+import uuid
+from functools import lru_cache
 from typing import Optional, Callable
 from enum import Enum
 
@@ -14,6 +14,63 @@ import numpy as np
 import sounddevice as sd
 import requests
 
+# Samples per audio block / volume meter window, and volume meter poll interval
+VOLUME_WINDOW = 1024
+VOLUME_POLL_MS = 50
+
+# Silence trimming before upload: 20 ms frames, int16 RMS threshold, padding kept
+VAD_FRAME_MS = 20
+VAD_RMS_THRESHOLD = 500
+VAD_PADDING_FRAMES = 10
+
+# 44-byte PCM WAV header: RIFF chunk, fmt chunk, data chunk header
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
+@lru_cache(maxsize=1)
+def _query_devices_cached() -> tuple:
+    """Enumerate audio devices once (PortAudio re-scans on every query)."""
+    return tuple(sd.query_devices())
+
+
+class _MultipartBody:
+    """
+    multipart/form-data body streamed from existing buffers.
+    requests sends it part by part with a Content-Length, so the audio is
+    never copied into one joined body.
+    """
+
+    def __init__(self, fields: dict, file_field: str, filename: str,
+                 file_type: str, file_parts: tuple):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        head = []
+        for name, value in fields.items():
+            head.append(
+                f'--{boundary}\r\n'
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f'{value}\r\n'
+            )
+        head.append(
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+            f'Content-Type: {file_type}\r\n\r\n'
+        )
+
+        self._parts = (
+            ''.join(head).encode('utf-8'),
+            *file_parts,
+            f'\r\n--{boundary}--\r\n'.encode('utf-8'),
+        )
+        self._length = sum(len(part) for part in self._parts)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        return iter(self._parts)
+
 
 class STTState(Enum):
     IDLE = "idle"
@@ -31,6 +88,10 @@ class STTEngine:
         self.api_key = api_key
         self.api_url = "https://api.groq.com/openai/v1/audio/transcriptions"
 
+        # Shared HTTP session - reuses the TLS connection to Groq between uploads
+        self._session = requests.Session()
+        self._session.headers['Authorization'] = f"Bearer {api_key}"
+
         # Audio settings
         self.sample_rate = 16000
         self.channels = 1
@@ -38,8 +99,13 @@ class STTEngine:
 
         # Recording state
         self.state = STTState.IDLE
-        self._audio_buffer = []
-        self._recording_thread: Optional[threading.Thread] = None
+        # Preallocated sample buffer (60 s, grown on demand) + write cursor
+        self._audio_buffer = np.empty(self.sample_rate * 60, dtype=self.dtype)
+        self._write_pos = 0
+        self._abs_scratch = np.empty(VOLUME_WINDOW, dtype=np.int32)  # reused by volume meter
+        self._recording_future: Optional[Future] = None
+        # Reused worker threads for recording and transcription
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='stt')
         self._stop_recording = threading.Event()
 
         # Language (for Whisper)
@@ -54,6 +120,7 @@ class STTEngine:
     def set_api_key(self, api_key: str):
         """Set Groq API key."""
         self.api_key = api_key
+        self._session.headers['Authorization'] = f"Bearer {api_key}"
 
     def set_language(self, language: str):
         """Set transcription language (ISO code, e.g., 'pl', 'en', 'de')."""
@@ -64,14 +131,13 @@ class STTEngine:
         if self.state != STTState.IDLE:
             return
 
-        self._audio_buffer = []
+        self._write_pos = 0
         self._stop_recording.clear()
 
         self._set_state(STTState.RECORDING)
 
         # Start recording in background thread
-        self._recording_thread = threading.Thread(target=self._record_audio, daemon=True)
-        self._recording_thread.start()
+        self._recording_future = self._executor.submit(self._record_audio)
 
     def stop_recording(self):
         """Stop recording and start transcription."""
@@ -81,15 +147,14 @@ class STTEngine:
         self._stop_recording.set()
 
         # Wait for recording thread
-        if self._recording_thread and self._recording_thread.is_alive():
-            self._recording_thread.join(timeout=2)
+        self._wait_for_recording()
 
         # Process audio
-        if self._audio_buffer:
+        if self._write_pos:
             self._set_state(STTState.PROCESSING)
 
             # Transcribe in background
-            threading.Thread(target=self._transcribe_audio, daemon=True).start()
+            self._executor.submit(self._transcribe_audio)
         else:
             self._set_state(STTState.IDLE)
 
@@ -97,12 +162,24 @@ class STTEngine:
         """Cancel recording without transcription."""
         self._stop_recording.set()
 
-        if self._recording_thread and self._recording_thread.is_alive():
-            self._recording_thread.join(timeout=2)
+        self._wait_for_recording()
 
-        self._audio_buffer = []
+        self._write_pos = 0
         self._set_state(STTState.IDLE)
 
+    def shutdown(self):
+        """Cancel recording and release worker threads (call on app exit)."""
+        self.cancel_recording()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _wait_for_recording(self):
+        """Wait (up to 2 s) for the recording task to finish."""
+        if self._recording_future and not self._recording_future.done():
+            try:
+                self._recording_future.result(timeout=2)
+            except FutureTimeout:
+                pass
+
     def is_recording(self) -> bool:
         return self.state == STTState.RECORDING
 
@@ -117,6 +194,13 @@ class STTEngine:
         if self.on_state_changed:
             self.on_state_changed(state)
 
+    def _recorded(self) -> np.ndarray:
+        """View of all samples published so far by the audio callback."""
+        # Read the cursor before the buffer: a buffer grown after this point
+        # still holds every sample up to pos, so the view is never torn
+        pos = self._write_pos
+        return self._audio_buffer[:pos]
+
     def _record_audio(self):
         """Background thread for recording audio."""
         try:
@@ -124,23 +208,37 @@ class STTEngine:
                 if status and self.on_error:
                     self.on_error(f"Audio status: {status}")
 
-                # Store audio data
-                self._audio_buffer.append(indata.copy())
-
-                # Calculate volume level for visualization
-                if self.on_volume_level:
-                    volume = np.abs(indata).mean()
-                    self.on_volume_level(float(volume))
+                # Store audio data in place, doubling the buffer when full.
+                # Single producer: samples (and a grown buffer) are stored
+                # before _write_pos is advanced, which publishes them.
+                end = self._write_pos + frames
+                if end > len(self._audio_buffer):
+                    self._audio_buffer = np.resize(
+                        self._audio_buffer, max(end, len(self._audio_buffer) * 2)
+                    )
+                self._audio_buffer[self._write_pos:end] = indata[:, 0]
+                self._write_pos = end
 
             with sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=self.channels,
                 dtype=self.dtype,
                 callback=audio_callback,
-                blocksize=1024
+                blocksize=VOLUME_WINDOW
             ):
+                # Volume level for visualization is computed here, not in the
+                # realtime audio callback, from the newest samples in the buffer
+                last_pos = 0
                 while not self._stop_recording.is_set():
-                    sd.sleep(100)
+                    sd.sleep(VOLUME_POLL_MS)
+                    samples = self._recorded()
+                    pos = len(samples)
+                    if self.on_volume_level and pos != last_pos:
+                        window = samples[max(0, pos - VOLUME_WINDOW):]
+                        scratch = self._abs_scratch[:len(window)]
+                        np.abs(window, out=scratch)
+                        self.on_volume_level(float(scratch.mean()))
+                    last_pos = pos
 
         except Exception as e:
             if self.on_error:
@@ -153,93 +251,95 @@ class STTEngine:
             if not self.api_key:
                 raise ValueError("Groq API key not set")
 
-            # Convert buffer to WAV file
-            audio_data = np.concatenate(self._audio_buffer)
-            wav_path = self._save_wav(audio_data)
+            # Convert buffer to WAV (header + view of the samples)
+            audio_data = self._trim_silence(self._recorded())
+            wav_parts = self._build_wav_parts(audio_data)
 
-            try:
-                # Send to Groq API
-                text = self._send_to_groq(wav_path)
-
-                if text and self.on_transcription:
-                    self.on_transcription(text)
+            # Send to Groq API
+            text = self._send_to_groq(wav_parts)
 
-            finally:
-                # Clean up temp file
-                if os.path.exists(wav_path):
-                    os.remove(wav_path)
+            if text and self.on_transcription:
+                self.on_transcription(text)
 
         except Exception as e:
             if self.on_error:
                 self.on_error(f"Transcription error: {str(e)}")
 
         finally:
-            self._audio_buffer = []
+            self._write_pos = 0
             self._set_state(STTState.IDLE)
 
-    def _save_wav(self, audio_data: np.ndarray) -> str:
-        """Save audio data to temporary WAV file."""
-        temp_file = tempfile.NamedTemporaryFile(
-            suffix='.wav',
-            delete=False,
-            prefix='claude_stt_'
+    def _trim_silence(self, audio_data: np.ndarray) -> np.ndarray:
+        """Drop leading/trailing silence (energy VAD); keeps everything if all quiet."""
+        frame_len = self.sample_rate * VAD_FRAME_MS // 1000
+        n_frames = len(audio_data) // frame_len
+        if n_frames == 0:
+            return audio_data
+
+        frames = audio_data[:n_frames * frame_len].reshape(-1, frame_len).astype(np.int32)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        voiced = np.flatnonzero(rms > VAD_RMS_THRESHOLD)
+        if len(voiced) == 0:
+            return audio_data
+
+        first = max(0, voiced[0] - VAD_PADDING_FRAMES)
+        last = min(n_frames, voiced[-1] + 1 + VAD_PADDING_FRAMES)
+        end = len(audio_data) if last == n_frames else last * frame_len
+        return audio_data[first * frame_len:end]
+
+    def _build_wav_parts(self, audio_data: np.ndarray) -> tuple:
+        """Encode audio data as a WAV file: (header bytes, sample buffer view)."""
+        # PCM16 little-endian; no-op view on LE hosts, so no tobytes() copy
+        samples = memoryview(np.ascontiguousarray(audio_data, dtype='<i2')).cast('B')
+        nbytes = len(samples)
+        block_align = self.channels * 2  # 16-bit
+
+        header = _WAV_HEADER.pack(
+            b'RIFF', 36 + nbytes, b'WAVE',
+            b'fmt ', 16, 1, self.channels, self.sample_rate,
+            self.sample_rate * block_align, block_align, 16,
+            b'data', nbytes
         )
-        temp_path = temp_file.name
-        temp_file.close()
-
-        with wave.open(temp_path, 'wb') as wav:
-            wav.setnchannels(self.channels)
-            wav.setsampwidth(2)  # 16-bit
-            wav.setframerate(self.sample_rate)
-            wav.writeframes(audio_data.tobytes())
-
-        return temp_path
-
-    def _send_to_groq(self, audio_path: str) -> str:
-        """Send audio file to Groq API for transcription."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}"
+        return header, samples
+
+    def _send_to_groq(self, wav_parts: tuple) -> str:
+        """Send WAV audio to Groq API for transcription."""
+        data = {
+            'model': 'whisper-large-v3',
+            'language': self.language,
+            'response_format': 'text'
         }
+        body = _MultipartBody(data, 'file', 'audio.wav', 'audio/wav', wav_parts)
 
-        with open(audio_path, 'rb') as audio_file:
-            files = {
-                'file': ('audio.wav', audio_file, 'audio/wav')
-            }
-            data = {
-                'model': 'whisper-large-v3',
-                'language': self.language,
-                'response_format': 'text'
-            }
-
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                files=files,
-                data=data,
-                timeout=30
-            )
+        response = self._session.post(
+            self.api_url,
+            data=body,
+            headers={'Content-Type': body.content_type},
+            timeout=30
+        )
 
-            if response.status_code == 200:
-                return response.text.strip()
-            else:
-                raise Exception(f"API error {response.status_code}: {response.text}")
+        if response.status_code == 200:
+            return response.text.strip()
+        else:
+            raise Exception(f"API error {response.status_code}: {response.text}")
 
     def get_available_devices(self) -> list:
         """Get list of available audio input devices."""
-        devices = []
-        for i, device in enumerate(sd.query_devices()):
-            if device['max_input_channels'] > 0:
-                devices.append({
-                    'id': i,
-                    'name': device['name'],
-                    'channels': device['max_input_channels'],
-                    'sample_rate': device['default_samplerate']
-                })
-        return devices
+        return [
+            {
+                'id': i,
+                'name': device['name'],
+                'channels': device['max_input_channels'],
+                'sample_rate': device['default_samplerate']
+            }
+            for i, device in enumerate(_query_devices_cached())
+            if device['max_input_channels'] > 0
+        ]
 
     def set_device(self, device_id: int):
         """Set audio input device."""
         sd.default.device = (device_id, None)
+        _query_devices_cached.cache_clear()
 
 
 # Language codes for Whisper
@@ -6,6 +6,30 @@ import re
 from typing import Optional, List
 
 
+# Complete 2-char sequences that survived intact (fix_polish_encoding, method 2)
+# Format: 'broken_sequence': 'correct_char'
+# These are UTF-8 bytes (c3 XX or c4 XX or c5 XX) interpreted as Latin-1
+_BROKEN_SEQUENCES = {
+    # Ã + second byte (C3 XX) - accented vowels
+    'Ã³': 'ó', 'Ã"': 'Ó',  # ó/Ó
+    'Ã¡': 'á', 'Ã': 'Á',  # á/Á
+    'Ã©': 'é', 'Ã‰': 'É',  # é/É
+    'Ã­': 'í', 'Ã': 'Í',  # í/Í
+    'Ãº': 'ú', 'Ãš': 'Ú',  # ú/Ú
+    'Ã±': 'ñ', 'Ã\x91': 'Ñ',  # ñ/Ñ
+    # Ä + second byte (C4 XX) - Polish ąćę
+    'Ä…': 'ą', 'Ä„': 'Ą',  # ą/Ą
+    'Ä‡': 'ć', 'Ä†': 'Ć',  # ć/Ć
+    'Ä™': 'ę', 'Ä˜': 'Ę',  # ę/Ę
+    # Å + second byte (C5 XX) - Polish łńśźż
+    'Å‚': 'ł', 'Å\x81': 'Ł',  # ł/Ł (note: Ł is C5 81)
+    'Å„': 'ń', 'Åƒ': 'Ń',  # ń/Ń
+    'Å›': 'ś', 'Åš': 'Ś',  # ś/Ś
+    'Åº': 'ź', 'Å¹': 'Ź',  # ź/Ź
+    'Å¼': 'ż', 'Å»': 'Ż',  # ż/Ż
+}
+
+
 def fix_polish_encoding(text: str) -> str:
     """
     Fix common UTF-8/Latin-1 encoding issues with Polish characters.
@@ -33,31 +57,10 @@ def fix_polish_encoding(text: str) -> str:
     except (UnicodeDecodeError, UnicodeEncodeError):
         pass
 
-    # Method 2: Fix complete 2-char sequences that survived intact
-    # Format: 'broken_sequence': 'correct_char'
-    # These are UTF-8 bytes (c3 XX or c4 XX or c5 XX) interpreted as Latin-1
-    complete_sequences = {
-        # Ã + second byte (C3 XX) - accented vowels
-        'Ã³': 'ó', 'Ã"': 'Ó',  # ó/Ó
-        'Ã¡': 'á', 'Ã': 'Á',  # á/Á
-        'Ã©': 'é', 'Ã‰': 'É',  # é/É
-        'Ã­': 'í', 'Ã': 'Í',  # í/Í
-        'Ãº': 'ú', 'Ãš': 'Ú',  # ú/Ú
-        'Ã±': 'ñ', 'Ã\x91': 'Ñ',  # ñ/Ñ
-        # Ä + second byte (C4 XX) - Polish ąćę
-        'Ä…': 'ą', 'Ä„': 'Ą',  # ą/Ą
-        'Ä‡': 'ć', 'Ä†': 'Ć',  # ć/Ć
-        'Ä™': 'ę', 'Ä˜': 'Ę',  # ę/Ę
-        # Å + second byte (C5 XX) - Polish łńśźż
-        'Å‚': 'ł', 'Å\x81': 'Ł',  # ł/Ł (note: Ł is C5 81)
-        'Å„': 'ń', 'Åƒ': 'Ń',  # ń/Ń
-        'Å›': 'ś', 'Åš': 'Ś',  # ś/Ś
-        'Åº': 'ź', 'Å¹': 'Ź',  # ź/Ź
-        'Å¼': 'ż', 'Å»': 'Ż',  # ż/Ż
-    }
+    # Method 2: Fix complete 2-char sequences that survived intact (_BROKEN_SEQUENCES)
 
     result = text
-    for broken, fixed_char in complete_sequences.items():
+    for broken, fixed_char in _BROKEN_SEQUENCES.items():
         result = result.replace(broken, fixed_char)
 
     # Method 3: Try to recover common Polish patterns from corrupted UTF-8
@@ -166,6 +169,16 @@ try:
 except ImportError:
     ENCHANT_AVAILABLE = False
 
+# Map language codes to enchant dictionary names
+_DICT_LANG_MAP = {
+    'pl-PL': 'pl_PL', 'pl_PL': 'pl_PL', 'pl': 'pl_PL',
+    'en-US': 'en_US', 'en_US': 'en_US', 'en': 'en_US',
+    'en-GB': 'en_GB', 'en_GB': 'en_GB',
+    'de-DE': 'de_DE', 'de_DE': 'de_DE', 'de': 'de_DE',
+    'fr-FR': 'fr_FR', 'fr_FR': 'fr_FR', 'fr': 'fr_FR',
+    'es-ES': 'es_ES', 'es_ES': 'es_ES', 'es': 'es_ES',
+}
+
 
 class TextCleanerForTTS:
     """
@@ -245,17 +258,7 @@ class TextCleanerForTTS:
         if not ENCHANT_AVAILABLE:
             return
 
-        # Map language codes
-        lang_map = {
-            'pl-PL': 'pl_PL', 'pl_PL': 'pl_PL', 'pl': 'pl_PL',
-            'en-US': 'en_US', 'en_US': 'en_US', 'en': 'en_US',
-            'en-GB': 'en_GB', 'en_GB': 'en_GB',
-            'de-DE': 'de_DE', 'de_DE': 'de_DE', 'de': 'de_DE',
-            'fr-FR': 'fr_FR', 'fr_FR': 'fr_FR', 'fr': 'fr_FR',
-            'es-ES': 'es_ES', 'es_ES': 'es_ES', 'es': 'es_ES',
-        }
-
-        dict_lang = lang_map.get(self.language, 'en_US')
+        dict_lang = _DICT_LANG_MAP.get(self.language, 'en_US')
 
         try:
             if enchant.dict_exists(dict_lang):
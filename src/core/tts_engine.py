@@ -4,16 +4,33 @@ Uses edge-tts for high-quality multilingual speech synthesis.
 Supports pause/resume functionality.
 """
 import asyncio
+import concurrent.futures
+from concurrent.futures import Future, ThreadPoolExecutor
 import tempfile
 import threading
 import os
+import re
 from pathlib import Path
+from queue import Queue, Empty, Full
 from typing import Optional, Callable
 from enum import Enum
 
 import edge_tts
 import pygame
 
+# How many sentences may be generated ahead of the one playing
+PREFETCH_SENTENCES = 2
+
+# edge-tts output format (24 kHz mono MP3)
+TTS_SAMPLE_RATE = 24000
+
+# Playback end re-check interval (seconds) once the clip length has elapsed,
+# e.g. after a pause; wakes at once on stop
+PLAYBACK_POLL_INTERVAL = 0.1
+
+# Split by sentence-ending punctuation
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
 
 class TTSState(Enum):
     IDLE = "idle"
@@ -46,11 +63,20 @@ class TTSEngine:
         self.on_finished: Optional[Callable[[], None]] = None
         self.on_error: Optional[Callable[[str], None]] = None
 
-        # Initialize pygame mixer
-        pygame.mixer.init()
+        # pygame mixer is opened on first speak(); sentences play as decoded
+        # Sounds on a reserved channel
+        self._channel: Optional[pygame.mixer.Channel] = None
+
+        # Long-lived event loop for edge-tts, shared by all generations
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
 
         # Thread control
-        self._play_thread: Optional[threading.Thread] = None
+        self._play_future: Optional[Future] = None
+        # Reused worker threads for playback and sentence prefetch; extra
+        # headroom so a speak() right after a slow stop() isn't queued
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='tts')
         self._stop_event = threading.Event()
         self._pause_event = threading.Event()
         self._pause_event.set()  # Not paused by default
@@ -74,6 +100,7 @@ class TTSEngine:
 
         # Stop any current playback
         self.stop()
+        self._ensure_mixer()
 
         self._current_text = text
         self._sentences = self._split_into_sentences(text)
@@ -84,21 +111,20 @@ class TTSEngine:
         self._pause_event.set()
 
         # Start playback in background thread
-        self._play_thread = threading.Thread(target=self._play_sentences, daemon=True)
-        self._play_thread.start()
+        self._play_future = self._executor.submit(self._play_sentences)
 
     def pause(self):
         """Pause playback."""
         if self.state == TTSState.PLAYING:
             self._pause_event.clear()
-            pygame.mixer.music.pause()
+            self._channel.pause()
             self._set_state(TTSState.PAUSED)
 
     def resume(self):
         """Resume playback from pause."""
         if self.state == TTSState.PAUSED:
             self._pause_event.set()
-            pygame.mixer.music.unpause()
+            self._channel.unpause()
             self._set_state(TTSState.PLAYING)
 
     def stop(self):
@@ -106,11 +132,15 @@ class TTSEngine:
         self._stop_event.set()
         self._pause_event.set()  # Unblock if paused
 
-        pygame.mixer.music.stop()
+        if self._channel:
+            self._channel.stop()
 
         # Wait for thread to finish
-        if self._play_thread and self._play_thread.is_alive():
-            self._play_thread.join(timeout=2)
+        if self._play_future and not self._play_future.done():
+            try:
+                self._play_future.result(timeout=2)
+            except concurrent.futures.TimeoutError:
+                pass
 
         # Clean up temp files
         self._cleanup_temp_files()
@@ -137,22 +167,19 @@ class TTSEngine:
 
     def _split_into_sentences(self, text: str) -> list:
         """Split text into sentences for better pause/resume experience."""
-        import re
-
-        # Split by sentence-ending punctuation
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-
-        # Filter empty sentences and strip whitespace
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        # If no sentences found, return original text as single item
-        if not sentences:
-            sentences = [text]
-
-        return sentences
+        # Filter empty sentences and strip whitespace; if none found,
+        # return original text as single item
+        return [s for s in (seg.strip() for seg in _SENTENCE_SPLIT.split(text)) if s] or [text]
 
     def _play_sentences(self):
-        """Background thread to generate and play sentences."""
+        """Background thread to play sentences while the next ones are generated."""
+        prefetched: Queue = Queue(maxsize=PREFETCH_SENTENCES)
+        cancelled = threading.Event()  # tells the producer to give up early
+        producer = self._executor.submit(
+            self._prefetch_audio,
+            list(self._sentences[self._current_sentence_index:]), prefetched, cancelled
+        )
+
         try:
             total = len(self._sentences)
 
@@ -166,26 +193,21 @@ class TTSEngine:
                 if self._stop_event.is_set():
                     break
 
-                sentence = self._sentences[self._current_sentence_index]
-
-                # Generate audio for this sentence
-                self._set_state(TTSState.GENERATING)
-                audio_file = self._generate_audio(sentence)
+                # Take the next generated sentence (only waits if not prefetched yet)
+                if prefetched.empty():
+                    self._set_state(TTSState.GENERATING)
+                sound = self._next_prefetched(prefetched)
 
                 if self._stop_event.is_set():
                     break
 
-                if audio_file:
+                if sound:
                     # Play the audio
                     self._set_state(TTSState.PLAYING)
-                    self._play_audio_file(audio_file)
+                    self._play_sound(sound)
 
                     # Wait for playback to finish
-                    while pygame.mixer.music.get_busy():
-                        if self._stop_event.is_set():
-                            break
-                        self._pause_event.wait()  # Block if paused
-                        pygame.time.wait(100)
+                    self._wait_for_playback(sound)
 
                 # Report progress
                 if self.on_progress:
@@ -205,8 +227,52 @@ class TTSEngine:
             self._set_state(TTSState.IDLE)
 
         finally:
+            cancelled.set()
+            try:
+                producer.result(timeout=2)
+            except concurrent.futures.TimeoutError:
+                pass
             self._cleanup_temp_files()
 
+    def _wait_for_playback(self, sound):
+        """Block until the current sentence finishes, is paused-through or stopped."""
+        # Sleep for the clip length in one wait; returns immediately on stop
+        if self._stop_event.wait(sound.get_length()):
+            return
+        # Still busy only if paused meanwhile (or mixer latency) - re-check rarely
+        while self._channel.get_busy():
+            self._pause_event.wait()  # Block if paused
+            if self._stop_event.wait(PLAYBACK_POLL_INTERVAL):
+                break
+
+    def _prefetch_audio(self, sentences: list, prefetched: Queue, cancelled: threading.Event):
+        """Producer thread: generate audio for upcoming sentences ahead of playback."""
+        for sentence in sentences:
+            if self._stop_event.is_set() or cancelled.is_set():
+                return
+
+            # Generate and decode here so playback starts without a load stall
+            audio_file = self._generate_audio(sentence)
+            sound = self._load_sound(audio_file) if audio_file else None
+
+            # Queue is bounded, so this blocks while enough audio is buffered
+            while True:
+                try:
+                    prefetched.put(sound, timeout=0.1)
+                    break
+                except Full:
+                    if self._stop_event.is_set() or cancelled.is_set():
+                        return
+
+    def _next_prefetched(self, prefetched: Queue) -> Optional[pygame.mixer.Sound]:
+        """Get the next generated sound, giving up if playback is stopped."""
+        while not self._stop_event.is_set():
+            try:
+                return prefetched.get(timeout=0.1)
+            except Empty:
+                continue
+        return None
+
     def _generate_audio(self, text: str) -> Optional[str]:
         """Generate audio file for text using edge-tts."""
         try:
@@ -221,8 +287,18 @@ class TTSEngine:
 
             self._temp_files.append(temp_path)
 
-            # Run async edge-tts
-            asyncio.run(self._async_generate(text, temp_path))
+            # Run async edge-tts on the shared loop, abandoning it on stop
+            future = asyncio.run_coroutine_threadsafe(
+                self._async_generate(text, temp_path), self._loop
+            )
+            while True:
+                try:
+                    future.result(timeout=0.1)
+                    break
+                except concurrent.futures.TimeoutError:
+                    if self._stop_event.is_set():
+                        future.cancel()
+                        return None
 
             return temp_path
 
@@ -241,11 +317,26 @@ class TTSEngine:
         )
         await communicate.save(output_path)
 
-    def _play_audio_file(self, file_path: str):
-        """Play audio file using pygame."""
+    def _ensure_mixer(self):
+        """Open the audio device in edge-tts' native format (no resampling)."""
+        if self._channel is None:
+            pygame.mixer.init(frequency=TTS_SAMPLE_RATE, channels=1)
+            pygame.mixer.set_reserved(1)
+            self._channel = pygame.mixer.Channel(0)
+
+    def _load_sound(self, file_path: str) -> Optional[pygame.mixer.Sound]:
+        """Decode audio file into memory using pygame."""
+        try:
+            return pygame.mixer.Sound(file_path)
+        except Exception as e:
+            if self.on_error:
+                self.on_error(f"Playback failed: {str(e)}")
+            return None
+
+    def _play_sound(self, sound: pygame.mixer.Sound):
+        """Play decoded sound on the TTS channel."""
         try:
-            pygame.mixer.music.load(file_path)
-            pygame.mixer.music.play()
+            self._channel.play(sound)
         except Exception as e:
             if self.on_error:
                 self.on_error(f"Playback failed: {str(e)}")
@@ -263,12 +354,18 @@ class TTSEngine:
     def get_available_voices(self) -> list:
         """Get list of available voices."""
         try:
-            voices = asyncio.run(edge_tts.list_voices())
-            return voices
+            future = asyncio.run_coroutine_threadsafe(edge_tts.list_voices(), self._loop)
+            return future.result(timeout=30)
         except:
             return []
 
+    def shutdown(self):
+        """Stop playback and release worker threads (call on app exit)."""
+        self.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def __del__(self):
         """Cleanup on destruction."""
-        self.stop()
+        self.shutdown()
         pygame.mixer.quit()
+        self._loop.call_soon_threadsafe(self._loop.stop)
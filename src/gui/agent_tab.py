@@ -3,13 +3,16 @@ Claude Voice Assistant - Agent Tab
 Single agent tab with terminal and input panel.
 """
 import json
+import re
+import time
+from functools import partial
 from pathlib import Path
 from typing import Optional, Dict, List, Callable
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QTextEdit, QPushButton, QToolButton, QCheckBox,
-    QFrame, QMenu, QAction, QLabel, QFileDialog,
+    QTextEdit, QPlainTextEdit, QPushButton, QToolButton, QCheckBox,
+    QFrame, QMenu, QLabel, QFileDialog,
     QMessageBox
 )
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer
@@ -24,14 +27,24 @@ except ImportError:
 
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_SRC_DIR = str(Path(__file__).parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from config import (
     MEMORY_PROJECTS_FILE, MEMORY_FILE_EXTENSIONS,
-    DEFAULT_QUICK_ACTIONS, QUICK_ACTIONS_FILE
+    DEFAULT_QUICK_ACTIONS, QUICK_ACTIONS_FILE, HOME_DIR
 )
 from gui.dialogs import styled_get_open_file_names
 
+# ANSI escapes to drop before TTS: CSI sequences (incl. private modes like ?25l) and OSC
+_ANSI_RE = re.compile(rb'\x1b\[[0-9;?]*[ -/]*[@-~]|\x1b\][^\x07]*\x07')
+
+# Terminal output batching / auto-read
+MAX_PENDING_OUTPUT = 64 * 1024  # flush early once a batch gets this big
+AUTO_READ_DELAY_MS = 2000       # quiet period before auto-reading output
+MAX_TTS_BUFFER = 5000           # keep only the tail of the output for TTS
+
 
 class AutoResizeTextEdit(QTextEdit):
     """Text input that auto-resizes based on content."""
@@ -40,7 +53,6 @@ class AutoResizeTextEdit(QTextEdit):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.document().contentsChanged.connect(self._adjust_height)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self._min_height = 55
@@ -48,12 +60,52 @@ class AutoResizeTextEdit(QTextEdit):
         self.setMinimumHeight(self._min_height)
         self.setMaximumHeight(self._min_height)
 
+        # Last measured (text length, wrap width) and the height applied for it
+        self._last_len = -1
+        self._last_width = -1
+        self._last_height = self._min_height
+
+        # Collapse bursts of edits into one relayout per frame (~16 ms)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._adjust_height)
+        self.document().contentsChanged.connect(self._resize_timer.start)
+
     def _adjust_height(self):
         """Adjust height based on content."""
-        doc_height = self.document().size().height()
-        new_height = max(self._min_height, min(int(doc_height) + 20, self._max_height))
-        self.setMinimumHeight(new_height)
-        self.setMaximumHeight(new_height)
+        # Hidden (window still being built, or a background tab) - showEvent
+        # schedules the measurement once the widget is actually shown
+        if not self.isVisible():
+            return
+
+        doc = self.document()
+        text_len = doc.characterCount()
+        width = self.viewport().width()
+        if text_len == self._last_len and width == self._last_width:
+            return
+        self._last_len = text_len
+        self._last_width = width
+
+        # Empty input always collapses to the minimum - no document layout needed
+        if doc.isEmpty():
+            self._set_height(self._min_height)
+            return
+
+        doc_height = doc.size().height()
+        self._set_height(max(self._min_height, min(int(doc_height) + 20, self._max_height)))
+
+    def _set_height(self, new_height: int):
+        """Apply a fixed height if it differs from the current one."""
+        if new_height != self._last_height:
+            self._last_height = new_height
+            self.setMinimumHeight(new_height)
+            self.setMaximumHeight(new_height)
+
+    def showEvent(self, event):
+        """Measure once when shown (edits while hidden were skipped)."""
+        super().showEvent(event)
+        self._resize_timer.start()
 
     def keyPressEvent(self, event):
         """Handle Enter key to send message."""
@@ -76,7 +128,7 @@ class AgentTab(QWidget):
 
     # Signals
     message_sent = pyqtSignal(str)  # Emitted when user sends a message
-    terminal_output = pyqtSignal(object)  # Emitted when terminal receives data
+    terminal_output = pyqtSignal(object)  # Emitted with ANSI-stripped bytes of each output batch
     status_changed = pyqtSignal(str)  # Emitted to update status bar
     request_tts = pyqtSignal(str)  # Request TTS to speak text
     request_tts_stop = pyqtSignal()  # Request TTS to stop
@@ -90,7 +142,7 @@ class AgentTab(QWidget):
         self.agent_config = agent_config
         self.agent_id = agent_config.get('id', 'unknown')
         self.agent_name = agent_config.get('name', 'Agent')
-        self.working_directory = agent_config.get('working_directory', str(Path.home()))
+        self.working_directory = agent_config.get('working_directory', str(HOME_DIR))
         self.memory_files = agent_config.get('memory_files', [])  # list of file paths
         self.auto_start = agent_config.get('auto_start', True)
         self.splitter_sizes = agent_config.get('splitter_sizes', [600, 150])
@@ -98,14 +150,18 @@ class AgentTab(QWidget):
         # State
         self.terminal = None
         self.conversation_area = None
-        self._terminal_output_buffer = ""
+        self._terminal_output_buffer = bytearray()  # ANSI-stripped output for TTS
+        self._pending_output = bytearray()  # raw PTY chunks waiting for the next flush
+        self._flush_timer = None
         self._tts_timer = None
+        self._tts_deadline = 0.0  # monotonic time when auto-read may fire
         self._memory_sent = False
         self.attached_files = []
         self.quick_actions = []
 
         # UI references (will be set by MainWindow for shared state)
         self.skin_colors = {}
+        self._window_active = True  # bottom panel uses the inactive color when False
         self.skin_icons = {}
         self.auto_read_responses = False
         self.current_language = "pl-PL"
@@ -130,6 +186,7 @@ class AgentTab(QWidget):
 
         # Main splitter (terminal + bottom panel)
         self.main_splitter = QSplitter(Qt.Vertical)
+        self.main_splitter.setObjectName("mainSplitter")
         self.main_splitter.setHandleWidth(6)
 
         # Terminal area
@@ -166,7 +223,7 @@ class AgentTab(QWidget):
             self.terminal.setFlowControlWarningEnabled(False)
             self.terminal.setTerminalSizeHint(False)
 
-            # Scrollbar styling
+            # Scrollbar styling (flat colors - gradients are re-rendered on every scroll)
             self.terminal.setStyleSheet("""
                 QScrollBar:vertical {
                     background: transparent;
@@ -174,14 +231,12 @@ class AgentTab(QWidget):
                     margin: 2px;
                 }
                 QScrollBar::handle:vertical {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #888888, stop:0.5 #aaaaaa, stop:1 #888888);
+                    background: #aaaaaa;
                     border-radius: 5px;
                     min-height: 30px;
                 }
                 QScrollBar::handle:vertical:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #999999, stop:0.5 #bbbbbb, stop:1 #999999);
+                    background: #bbbbbb;
                 }
                 QScrollBar::add-line:vertical,
                 QScrollBar::sub-line:vertical {
@@ -197,10 +252,15 @@ class AgentTab(QWidget):
             self.terminal.receivedData.connect(self._on_terminal_output)
             self.terminal.finished.connect(self._on_terminal_finished)
 
+            # Output batching timer - coalesces PTY chunks into one flush per frame
+            self._flush_timer = QTimer(self)
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.timeout.connect(self._flush_terminal_output)
+
             # TTS timer
             self._tts_timer = QTimer()
             self._tts_timer.setSingleShot(True)
-            self._tts_timer.timeout.connect(self._read_terminal_buffer)
+            self._tts_timer.timeout.connect(self._on_tts_timer)
 
             # Start shell
             self.terminal.startShellProgram()
@@ -208,15 +268,16 @@ class AgentTab(QWidget):
             self.main_splitter.addWidget(self.terminal)
             self.conversation_area = None
         else:
-            # Fallback
+            # Fallback - plain-text log (line-based layout, capped like terminal history)
             self.terminal = None
-            self.conversation_area = QTextEdit()
+            self.conversation_area = QPlainTextEdit()
             self.conversation_area.setReadOnly(True)
+            self.conversation_area.setMaximumBlockCount(10000)
             terminal_font = QFont("Ubuntu Mono", 13)
             terminal_font.setStyleHint(QFont.Monospace)
             self.conversation_area.setFont(terminal_font)
             self.conversation_area.setStyleSheet("""
-                QTextEdit {
+                QPlainTextEdit {
                     background-color: #300A24;
                     color: #ffffff;
                     border: 1px solid #4a1a3a;
@@ -229,6 +290,7 @@ class AgentTab(QWidget):
     def _setup_bottom_panel(self):
         """Setup bottom panel with input and controls."""
         self.bottom_panel = QFrame()
+        self.bottom_panel.setObjectName("bottomPanel")
         bottom_layout = QVBoxLayout(self.bottom_panel)
         bottom_layout.setContentsMargins(12, 12, 12, 12)
         bottom_layout.setSpacing(10)
@@ -254,6 +316,7 @@ class AgentTab(QWidget):
         layout = QHBoxLayout()
 
         self.input_field = AutoResizeTextEdit()
+        self.input_field.setObjectName("inputField")
         self.input_field.setPlaceholderText("Wpisz polecenie lub użyj dyktowania... (Shift+Enter = nowa linia)")
         input_font = QFont("Ubuntu Mono", 13)
         input_font.setStyleHint(QFont.Monospace)
@@ -335,6 +398,8 @@ class AgentTab(QWidget):
         self.quick_actions_btn.setToolTip("Szybkie akcje")
         self.quick_actions_btn.setPopupMode(QToolButton.InstantPopup)
         self.quick_actions_btn.setFixedSize(btn_size, btn_size)
+        self._quick_actions_menu = QMenu(self.quick_actions_btn)
+        self.quick_actions_btn.setMenu(self._quick_actions_menu)
         self._update_quick_actions_menu()
         layout.addWidget(self.quick_actions_btn)
 
@@ -363,22 +428,20 @@ class AgentTab(QWidget):
 
     def _update_quick_actions_menu(self):
         """Update quick actions dropdown menu."""
-        menu = QMenu(self.quick_actions_btn)
+        # Reuse the menu; clear() deletes the actions it owns
+        menu = self._quick_actions_menu
+        menu.clear()
 
         for action in self.quick_actions:
-            item = QAction(action['label'], self)
-            item.triggered.connect(lambda checked, cmd=action['command']: self._insert_quick_action(cmd))
-            menu.addAction(item)
+            item = menu.addAction(action['label'])
+            item.triggered.connect(partial(self._insert_quick_action, action['command']))
 
         menu.addSeparator()
 
-        add_action = QAction("➕ Dodaj własną...", self)
+        add_action = menu.addAction("➕ Dodaj własną...")
         add_action.triggered.connect(self._add_quick_action)
-        menu.addAction(add_action)
-
-        self.quick_actions_btn.setMenu(menu)
 
-    def _insert_quick_action(self, command: str):
+    def _insert_quick_action(self, command: str, checked: bool = False):
         """Insert quick action command into input field."""
         self.input_field.setText(command)
         self.input_field.setFocus()
@@ -390,48 +453,86 @@ class AgentTab(QWidget):
     # ==================== Terminal Handling ====================
 
     def _on_terminal_output(self, data):
-        """Handle terminal output for TTS."""
+        """Collect terminal output; it is processed in batches by _flush_terminal_output."""
         if not self.terminal:
             return
 
-        # Emit signal for MainWindow
-        self.terminal_output.emit(data)
-
+        # QByteArray exposes the buffer protocol - append it straight into the
+        # batch instead of copying it out to bytes first
         try:
-            text = data.data().decode('utf-8', errors='ignore')
-        except:
-            text = str(data)
+            self._pending_output += data
+        except TypeError:
+            self._pending_output += data.data()
+
+        # Don't let a long burst grow the batch without bound
+        if len(self._pending_output) >= MAX_PENDING_OUTPUT:
+            self._flush_timer.stop()
+            self._flush_terminal_output()
+            return
+
+        # Arm the flush once per batch instead of restarting it per chunk.
+        # Full-screen repaints arrive in several chunks, so give them longer.
+        if not self._flush_timer.isActive():
+            # Timer idle means the batch holds only this chunk
+            batch = self._pending_output
+            repaint = b'\x1b[2J' in batch or b'\x1b[H' in batch
+            self._flush_timer.start(32 if repaint else 16)
+
+    def _flush_terminal_output(self):
+        """Handle batched terminal output for TTS."""
+        if not self._pending_output:
+            return
+
+        # Clean ANSI codes - one pass over the whole batch
+        clean = _ANSI_RE.sub(b'', self._pending_output).strip()
+        del self._pending_output[:]
 
-        # Clean ANSI codes
-        import re
-        clean_text = re.sub(r'\x1b\[[0-9;]*[a-zA-Z]', '', text)
-        clean_text = re.sub(r'\x1b\][^\x07]*\x07', '', clean_text)
-        clean_text = clean_text.strip()
+        if clean:
+            # Emit signal for MainWindow - already cleaned, so it doesn't
+            # have to strip the same batch again
+            self.terminal_output.emit(clean)
 
-        if clean_text:
-            self._terminal_output_buffer += clean_text + "\n"
+            buf = self._terminal_output_buffer
+            buf += clean
+            buf += b"\n"
 
-            # Limit buffer size
-            if len(self._terminal_output_buffer) > 5000:
-                self._terminal_output_buffer = self._terminal_output_buffer[-5000:]
+            # Limit buffer size - drop the head in place
+            if len(buf) > MAX_TTS_BUFFER:
+                del buf[:-MAX_TTS_BUFFER]
 
-            # Auto-read timer
+            # Auto-read after a quiet period: push the deadline forward and
+            # only arm the timer when idle (see _on_tts_timer)
             if self.auto_read_responses and self._tts_timer:
-                self._tts_timer.stop()
-                self._tts_timer.start(2000)
+                self._tts_deadline = time.monotonic() + AUTO_READ_DELAY_MS / 1000
+                if not self._tts_timer.isActive():
+                    self._tts_timer.start(AUTO_READ_DELAY_MS)
 
     def _on_terminal_finished(self):
         """Handle terminal process finished."""
         self.status_changed.emit("Terminal zakończony")
 
+    def _on_tts_timer(self):
+        """Read the buffer once output has been quiet until the deadline."""
+        remaining = self._tts_deadline - time.monotonic()
+        if remaining > 0:
+            self._tts_timer.start(max(1, int(remaining * 1000)))
+            return
+        self._read_terminal_buffer()
+
     def _read_terminal_buffer(self):
         """Read accumulated terminal output via TTS."""
-        if not self._terminal_output_buffer.strip():
+        text = self._take_terminal_text()
+        if not text.strip():
             return
 
         # Request TTS from MainWindow
-        self.request_tts.emit(self._terminal_output_buffer)
-        self._terminal_output_buffer = ""
+        self.request_tts.emit(text)
+
+    def _take_terminal_text(self) -> str:
+        """Decode and clear the TTS buffer (keeps its allocation)."""
+        text = self._terminal_output_buffer.decode('utf-8', errors='ignore')
+        del self._terminal_output_buffer[:]
+        return text
 
     # ==================== Message Handling ====================
 
@@ -452,7 +553,7 @@ class AgentTab(QWidget):
                 self.terminal.sendText("\r")
         elif self.conversation_area:
             if full_message:
-                self.conversation_area.append(f">>> {full_message}")
+                self.conversation_area.appendPlainText(f">>> {full_message}")
                 self.input_field.clear()
                 self._clear_attachments()
 
@@ -529,9 +630,9 @@ class AgentTab(QWidget):
 
     def _read_last_response(self):
         """Request TTS to read last response."""
-        if self._terminal_output_buffer.strip():
-            self.request_tts.emit(self._terminal_output_buffer)
-            self._terminal_output_buffer = ""
+        text = self._take_terminal_text()
+        if text.strip():
+            self.request_tts.emit(text)
 
     def _toggle_pause(self):
         """Toggle TTS pause."""
@@ -569,7 +670,7 @@ class AgentTab(QWidget):
         )
 
         files, _ = styled_get_open_file_names(
-            self, "Dodaj pliki", str(Path.home()), file_filter
+            self, "Dodaj pliki", str(HOME_DIR), file_filter
         )
 
         if files:
@@ -665,35 +766,46 @@ class AgentTab(QWidget):
         self.setPalette(palette)
         self.setAutoFillBackground(True)
 
-        # Splitter styling - set background and handle
+        self._apply_tab_stylesheet()
+
+        # Note: Terminal colors are applied by MainWindow._apply_terminal_colors()
+        # which creates a custom color scheme and applies it to all terminals
+
+    def set_window_active(self, active: bool):
+        """Switch the bottom panel between the active and inactive skin color."""
+        if active != self._window_active:
+            self._window_active = active
+            self._apply_tab_stylesheet()
+
+    def _apply_tab_stylesheet(self):
+        """Build and set the tab-level stylesheet from the current skin."""
+        skin_colors = self.skin_colors
+        main_bg = skin_colors.get('main_window_bg', '#300A24')
         splitter_color = skin_colors.get('splitter_color', '#4a1a3a')
-        self.main_splitter.setStyleSheet(f"""
-            QSplitter {{
+        if self._window_active:
+            panel_bg = skin_colors.get('bottom_panel_bg', '#131314')
+        else:
+            panel_bg = skin_colors.get('inactive_panel_bg', '#3a3a3c')
+        input_bg = skin_colors.get('input_bg', '#300A24')
+        text_color = skin_colors.get('text_color', '#ffffff')
+        border_color = skin_colors.get('border_color', '#4a1a3a')
+        hover_color = skin_colors.get('hover_color', '#6a2a5a')
+
+        # One stylesheet for the whole tab (splitter, bottom panel, input field)
+        # so Qt parses and cascades once per skin / activation change
+        self.setStyleSheet(f"""
+            QSplitter#mainSplitter {{
                 background-color: {main_bg};
             }}
-            QSplitter::handle {{
+            QSplitter#mainSplitter::handle {{
                 background-color: {splitter_color};
             }}
-        """)
-
-        # Bottom panel
-        bottom_bg = skin_colors.get('bottom_panel_bg', '#131314')
-        self.bottom_panel.setStyleSheet(f"""
-            QFrame {{
-                background-color: {bottom_bg};
+            QFrame#bottomPanel, QFrame#bottomPanel QFrame {{
+                background-color: {panel_bg};
                 border-radius: 10px;
                 padding: 5px;
             }}
-        """)
-
-        # Input field
-        input_bg = skin_colors.get('input_bg', '#300A24')
-        text_color = skin_colors.get('text_color', '#ffffff')
-        border_color = skin_colors.get('border_color', '#4a1a3a')
-        hover_color = skin_colors.get('hover_color', '#6a2a5a')
-
-        self.input_field.setStyleSheet(f"""
-            QTextEdit {{
+            QFrame#bottomPanel QTextEdit#inputField {{
                 background-color: {input_bg};
                 color: {text_color};
                 border: 2px solid {border_color};
@@ -701,14 +813,11 @@ class AgentTab(QWidget):
                 padding: 12px;
                 selection-background-color: {hover_color};
             }}
-            QTextEdit:focus {{
+            QFrame#bottomPanel QTextEdit#inputField:focus {{
                 border: 2px solid {hover_color};
             }}
         """)
 
-        # Note: Terminal colors are applied by MainWindow._apply_terminal_colors()
-        # which creates a custom color scheme and applies it to all terminals
-
     def get_config(self) -> dict:
         """Get current agent configuration."""
         return {
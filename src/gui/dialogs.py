@@ -19,11 +19,13 @@ from PyQt5.QtGui import QFont
 
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_SRC_DIR = str(Path(__file__).parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from config import (
     MEMORY_PROJECTS_FILE, AGENTS_FILE, MEMORY_FILE_EXTENSIONS,
-    DEFAULT_AGENTS, DEFAULT_MEMORY_PROJECTS, ASSETS_DIR
+    DEFAULT_AGENTS, DEFAULT_MEMORY_PROJECTS, ASSETS_DIR, HOME_DIR, ensure_config_dir
 )
 
 
@@ -159,7 +161,7 @@ def setup_file_dialog_labels(dialog: QFileDialog):
 
 def styled_get_existing_directory(parent, title: str, directory: str = "") -> str:
     """Stylizowany dialog wyboru katalogu z polskimi etykietami."""
-    dialog = QFileDialog(parent, title, directory or str(Path.home()))
+    dialog = QFileDialog(parent, title, directory or str(HOME_DIR))
     dialog.setFileMode(QFileDialog.Directory)
     dialog.setOption(QFileDialog.ShowDirsOnly, True)
     dialog.setOption(QFileDialog.DontUseNativeDialog, True)
@@ -175,7 +177,7 @@ def styled_get_existing_directory(parent, title: str, directory: str = "") -> st
 def styled_get_open_file_names(parent, title: str, directory: str = "",
                                 file_filter: str = "") -> tuple:
     """Stylizowany dialog wyboru wielu plików z polskimi etykietami."""
-    dialog = QFileDialog(parent, title, directory or str(Path.home()), file_filter)
+    dialog = QFileDialog(parent, title, directory or str(HOME_DIR), file_filter)
     dialog.setFileMode(QFileDialog.ExistingFiles)
     dialog.setOption(QFileDialog.DontUseNativeDialog, True)
     dialog.setStyleSheet(get_file_dialog_stylesheet())
@@ -189,7 +191,7 @@ def styled_get_open_file_names(parent, title: str, directory: str = "",
 def styled_get_open_file_name(parent, title: str, directory: str = "",
                                file_filter: str = "") -> tuple:
     """Stylizowany dialog wyboru pojedynczego pliku z polskimi etykietami."""
-    dialog = QFileDialog(parent, title, directory or str(Path.home()), file_filter)
+    dialog = QFileDialog(parent, title, directory or str(HOME_DIR), file_filter)
     dialog.setFileMode(QFileDialog.ExistingFile)
     dialog.setOption(QFileDialog.DontUseNativeDialog, True)
     dialog.setStyleSheet(get_file_dialog_stylesheet())
@@ -204,7 +206,7 @@ def styled_get_open_file_name(parent, title: str, directory: str = "",
 def styled_get_save_file_name(parent, title: str, directory: str = "",
                                file_filter: str = "") -> tuple:
     """Stylizowany dialog zapisu pliku z polskimi etykietami."""
-    dialog = QFileDialog(parent, title, directory or str(Path.home()), file_filter)
+    dialog = QFileDialog(parent, title, directory or str(HOME_DIR), file_filter)
     dialog.setFileMode(QFileDialog.AnyFile)
     dialog.setAcceptMode(QFileDialog.AcceptSave)
     dialog.setOption(QFileDialog.DontUseNativeDialog, True)
@@ -243,6 +245,7 @@ class MemoryProjectsDialog(QDialog):
     def _save_memory_projects(self):
         """Save memory projects to file."""
         try:
+            ensure_config_dir()
             with open(MEMORY_PROJECTS_FILE, 'w') as f:
                 json.dump(self.memory_projects, f, indent=2, ensure_ascii=False)
         except Exception as e:
@@ -419,7 +422,7 @@ class MemoryProjectsDialog(QDialog):
         # File dialog (stylizowany)
         file_filter = "Pliki pamięci (*.md *.txt *.json);;Wszystkie pliki (*)"
         files, _ = styled_get_open_file_names(
-            self, "Wybierz pliki pamięci", str(Path.home()), file_filter
+            self, "Wybierz pliki pamięci", str(HOME_DIR), file_filter
         )
 
         if files:
@@ -450,7 +453,7 @@ class MemoryProjectsDialog(QDialog):
 
         # Folder dialog (stylizowany)
         folder = styled_get_existing_directory(
-            self, "Wybierz folder z plikami", str(Path.home())
+            self, "Wybierz folder z plikami", str(HOME_DIR)
         )
 
         if folder:
@@ -653,7 +656,7 @@ class AgentConfigDialog(QDialog):
 
         # Working directory
         dir_layout = QHBoxLayout()
-        self.dir_input = QLineEdit(self.agent.get('working_directory', str(Path.home())))
+        self.dir_input = QLineEdit(self.agent.get('working_directory', str(HOME_DIR)))
         self.dir_input.setStyleSheet("""
             QLineEdit {
                 background-color: #2d0a1e;
@@ -766,7 +769,7 @@ class AgentConfigDialog(QDialog):
         """Browse for working directory."""
         directory = styled_get_existing_directory(
             self, "Wybierz katalog roboczy",
-            self.dir_input.text() or str(Path.home())
+            self.dir_input.text() or str(HOME_DIR)
         )
         if directory:
             self.dir_input.setText(directory)
@@ -862,7 +865,7 @@ class AgentConfigDialog(QDialog):
         """Open file dialog to add memory files."""
         file_filter = "Pliki pamięci (*.md *.txt *.json);;Wszystkie pliki (*)"
         files, _ = styled_get_open_file_names(
-            self, "Wybierz pliki pamięci", str(Path.home()), file_filter
+            self, "Wybierz pliki pamięci", str(HOME_DIR), file_filter
         )
 
         if not files:
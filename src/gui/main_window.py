@@ -2,10 +2,13 @@
 Claude Voice Assistant - Main Window
 PyQt5-based GUI for the application.
 """
+import os
 import sys
 import json
+import re
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from datetime import datetime
 
 from PyQt5.QtWidgets import (
@@ -18,16 +21,59 @@ from PyQt5.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
     QTabWidget, QTabBar
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize, QObject, QEvent, QPoint
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QSize, QObject, QEvent, QPoint, QRunnable, QThreadPool
+)
 from PyQt5.QtGui import QFont, QTextCursor, QIcon, QKeySequence, QPalette, QColor, QTextCharFormat
 
+# Engines are imported lazily on first use; these are for annotations only
+if TYPE_CHECKING:
+    from core.tts_engine import TTSState
+    from core.stt_engine import STTState
+
 # QTermWidget for real terminal emulation
 try:
     from QTermWidget import QTermWidget
     QTERMWIDGET_AVAILABLE = True
 except ImportError:
     QTERMWIDGET_AVAILABLE = False
-    print("Warning: QTermWidget not available, using fallback QTextEdit")
+    print("Warning: QTermWidget not available, using fallback QPlainTextEdit")
+
+# Use orjson for config serialization if available
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_config_file(path: Path, data: bytes, what: str):
+    """Write serialized config to file atomically (temp file + rename)."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        ensure_config_dir()
+        # One write of the pre-serialized bytes, then swap it in - a crash
+        # mid-write leaves the previous file intact
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"Error saving {what}: {e}")
+
+
+class _ConfigWriteTask(QRunnable):
+    """Writes a config file on a worker thread."""
+
+    def __init__(self, path: Path, data: bytes, what: str):
+        super().__init__()
+        self.path = path
+        self.data = data
+        self.what = what
+
+    def run(self):
+        _write_config_file(self.path, self.data, self.what)
 
 
 class SignalBridge(QObject):
@@ -245,18 +291,18 @@ class AutoResizeTextEdit(QTextEdit):
 
 # Import our modules
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_SRC_DIR = str(Path(__file__).parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from config import (
     APP_NAME, APP_VERSION, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT,
-    SUPPORTED_LANGUAGES, UI_TRANSLATIONS, DEFAULT_QUICK_ACTIONS,
+    SUPPORTED_LANGUAGES, LANG_TO_VOICE, DEFAULT_QUICK_ACTIONS, tr,
     CONFIG_FILE, QUICK_ACTIONS_FILE, CLAUDE_COMMAND, GROQ_API_KEY,
     AGENTS_FILE, MEMORY_PROJECTS_FILE, DEFAULT_AGENTS, DEFAULT_MEMORY_PROJECTS,
-    ASSETS_DIR
+    ASSETS_DIR, HOME_DIR, ensure_config_dir
 )
 from core.claude_bridge import ClaudeBridgeAsync
-from core.tts_engine import TTSEngine, TTSState
-from core.stt_engine import STTEngine, STTState
 from core.license_manager import LicenseManager, LicenseStatus
 from core.text_cleaner import TextCleanerForTTS, extract_last_claude_response, fix_polish_encoding
 from gui.agent_tab import AgentTab
@@ -265,6 +311,34 @@ from gui.dialogs import (
     styled_get_open_file_names, styled_get_open_file_name, styled_get_save_file_name
 )
 
+# App-generated lines in the fallback conversation view that TTS must skip
+_SYS_LINE_RE = re.compile(r'(?m)^(?:\[System\]|⏳ Processing\.\.\.).*\n?')
+
+# Translation keys of the tab button tooltips
+_TOOLTIP_KEYS = ('dictate', 'read', 'copy', 'clear_input', 'add_media', 'pause', 'stop', 'send')
+
+# Input placeholder per base language code
+_PLACEHOLDERS = {
+    'en': "Type a command or use dictation...",
+    'pl': "Wpisz polecenie lub użyj dyktowania...",
+}
+
+
+@lru_cache(maxsize=None)
+def _ui_labels(lang: str) -> dict:
+    """All language-dependent UI strings for one language, built once."""
+    labels = {key: tr(lang, key) for key in _TOOLTIP_KEYS}
+    labels['auto_read'] = tr(lang, 'auto_read')
+    labels['placeholder'] = _PLACEHOLDERS.get(lang[:2], _PLACEHOLDERS['en'])
+    labels['title'] = f"{tr(lang, 'app_title')} v{APP_VERSION}"
+    return labels
+
+
+def _set_if_changed(getter, setter, value: str):
+    """Call setter(value) only if getter() differs - Qt repaints even on no-op sets."""
+    if getter() != value:
+        setter(value)
+
 # Domyślne kolory skórki (motyw Ubuntu) - interfejs + terminal
 DEFAULT_SKIN_COLORS = {
     # === Kolory interfejsu ===
@@ -395,9 +469,11 @@ class MainWindow(QMainWindow):
 
         # Initialize managers
         self.claude = ClaudeBridgeAsync(CLAUDE_COMMAND)
-        self.tts = TTSEngine()
-        self.stt = STTEngine()
-        self.license_manager = LicenseManager()
+        # TTS/STT (and their audio stacks) are created on first use - see tts/stt properties
+        self._tts = None
+        self._stt = None
+        self._groq_api_key = ""
+        self.license_manager = LicenseManager(app_version=APP_VERSION)
 
         # Settings
         self.current_language = "pl-PL"
@@ -408,12 +484,49 @@ class MainWindow(QMainWindow):
         self.skin_icons = {k: v.copy() for k, v in DEFAULT_SKIN_ICONS.items()}  # Custom icons
         self.claude_command = "/usr/bin/claude"  # Command to run Claude Code
         self.auto_run_claude = True  # Auto-run Claude command on startup
+        self.anthropic_api_key = ""
 
         # Agents and memory projects
         self.agents = self._load_agents()
         self.memory_projects = self._load_memory_projects()
         self.agent_tabs = {}  # Dict of agent_id -> AgentTab
 
+        # Last terminal color scheme written to disk (skip identical rewrites)
+        self._terminal_scheme_content = None
+
+        # Config writes run on a single background thread so they stay ordered
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+
+        # Settings saves are debounced - bursts of changes cost one write
+        self._settings_dirty = False
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(500)
+        self._settings_save_timer.timeout.connect(self._flush_settings)
+
+        # Streamed Claude output is buffered and inserted in ~30 ms batches
+        self._claude_buf = []  # (is_processing, text)
+
+        # Conversation text formats, built once (insertText copies them)
+        self._fmt_plain = QTextCharFormat()
+        self._fmt_processing = QTextCharFormat()
+        self._fmt_processing.setForeground(QColor("#a78bfa"))  # purple
+        self._fmt_ai = QTextCharFormat()
+        self._fmt_ai.setForeground(QColor("#e4e4e7"))  # white
+        self._fmt_user = QTextCharFormat()
+        self._fmt_user.setForeground(QColor("#f59e0b"))  # yellow/orange
+        self._fmt_user.setFontWeight(QFont.Bold)
+        self._fmt_system = QTextCharFormat()
+        self._fmt_system.setForeground(QColor("#22d3ee"))  # cyan
+
+        # Cursor at the start of the last user message in the fallback
+        # conversation view (QTextCursor keeps tracking it through edits)
+        self._last_user_msg_cursor = None
+        self._claude_flush_timer = QTimer(self)
+        self._claude_flush_timer.setSingleShot(True)
+        self._claude_flush_timer.timeout.connect(self._flush_claude_buf)
+
         # Load settings
         self._load_settings()
 
@@ -462,35 +575,8 @@ class MainWindow(QMainWindow):
         self.tab_widget.tabCloseRequested.connect(self._close_agent_tab)
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
-        # Style for tabs
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background-color: transparent;
-            }
-            QTabBar::tab {
-                background-color: #2d0a1e;
-                color: #ffffff;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-            }
-            QTabBar::tab:selected {
-                background-color: #4a1a3a;
-            }
-            QTabBar::tab:hover {
-                background-color: #6a2a5a;
-            }
-            QTabBar::close-button {
-                image: none;
-                subcontrol-position: right;
-            }
-            QTabBar::close-button:hover {
-                background-color: #ef4444;
-                border-radius: 2px;
-            }
-        """)
+        # Styled by apply_skin_colors() via the window stylesheet
+        self.tab_widget.setObjectName("agentTabs")
 
         # Create dropdown menu for "+" tab
         self._add_tab_menu = QMenu(self)
@@ -546,7 +632,7 @@ class MainWindow(QMainWindow):
         self.conversation_area = None
         self.bottom_panel = None
         self.input_field = None
-        self._terminal_output_buffer = ""
+        self._terminal_output_buffer = bytearray()  # ANSI-stripped terminal output for TTS
         self._scroll_manager = None
 
         # Animation timers (shared across all tabs)
@@ -612,6 +698,7 @@ class MainWindow(QMainWindow):
     def _save_agents(self):
         """Save agents to file."""
         try:
+            ensure_config_dir()
             with open(AGENTS_FILE, 'w') as f:
                 json.dump(self.agents, f, indent=2, ensure_ascii=False)
         except Exception as e:
@@ -786,7 +873,7 @@ class MainWindow(QMainWindow):
         terminal_config = {
             'id': terminal_id,
             'name': f"Terminal {terminal_count + 1}",
-            'working_directory': str(Path.home()),
+            'working_directory': str(HOME_DIR),
             'memory_project_id': None,
             'auto_start': False,  # Don't auto-run Claude command
             'send_memory_on_start': False,  # No memory files
@@ -867,7 +954,7 @@ class MainWindow(QMainWindow):
             self.conversation_area = current_tab.conversation_area
             self.bottom_panel = current_tab.bottom_panel
             self.input_field = current_tab.input_field
-            self._terminal_output_buffer = current_tab._terminal_output_buffer
+            self._terminal_output_buffer = bytearray(current_tab._terminal_output_buffer)
 
     def _get_current_agent_tab(self) -> Optional[AgentTab]:
         """Get current agent tab."""
@@ -988,14 +1075,17 @@ class MainWindow(QMainWindow):
         # Language menu
         self.language_menu = menubar.addMenu("Język")
         self.language_actions = {}
+        self._current_lang_action = None  # the checked entry, see _set_language
 
         for code, (native, english, voice) in SUPPORTED_LANGUAGES.items():
             action = QAction(f"{native} ({english})", self)
             action.setCheckable(True)
             action.setChecked(code == self.current_language)
-            action.triggered.connect(lambda checked, c=code: self._set_language(c))
+            action.triggered.connect(partial(self._set_language, code))
             self.language_menu.addAction(action)
             self.language_actions[code] = action
+            if code == self.current_language:
+                self._current_lang_action = action
 
         # Settings menu
         settings_menu = menubar.addMenu("Ustawienia")
@@ -1038,18 +1128,50 @@ class MainWindow(QMainWindow):
         self.signals.stt_error.connect(self._on_stt_error)
 
         # Claude bridge - emit signals instead of direct callbacks
-        self.claude.connect_output(lambda t: self.signals.output_received.emit(t))
-        self.claude.connect_response(lambda t: self.signals.response_received.emit(t))
-        self.claude.connect_error(lambda t: self.signals.error_received.emit(t))
-
-        # TTS - emit signals instead of direct callbacks
-        self.tts.on_state_changed = lambda s: self.signals.tts_state_changed.emit(s)
-        self.tts.on_finished = lambda: self.signals.tts_finished.emit()
-
-        # STT - emit signals instead of direct callbacks
-        self.stt.on_state_changed = lambda s: self.signals.stt_state_changed.emit(s)
-        self.stt.on_transcription = lambda t: self.signals.stt_transcription.emit(t)
-        self.stt.on_error = lambda e: self.signals.stt_error.emit(e)
+        self.claude.connect_output(self.signals.output_received.emit)
+        self.claude.connect_response(self.signals.response_received.emit)
+        self.claude.connect_error(self.signals.error_received.emit)
+
+        # TTS/STT callbacks are wired in _wire_tts/_wire_stt when the engines are created
+
+    @property
+    def tts(self):
+        """TTS engine, created on first use."""
+        if self._tts is None:
+            from core.tts_engine import TTSEngine
+            self._tts = TTSEngine()
+            voice = LANG_TO_VOICE.get(self.current_language)
+            if voice:
+                self._tts.set_voice(voice)
+            self._wire_tts()
+        return self._tts
+
+    @property
+    def stt(self):
+        """STT engine, created on first use."""
+        if self._stt is None:
+            from core.stt_engine import STTEngine
+            self._stt = STTEngine(self._groq_api_key)
+            self._stt.set_language(self.current_language.split('-')[0])
+            self._wire_stt()
+        return self._stt
+
+    def _wire_tts(self):
+        """TTS - emit signals instead of direct callbacks."""
+        self._tts.on_state_changed = self.signals.tts_state_changed.emit
+        self._tts.on_finished = self.signals.tts_finished.emit
+
+    def _wire_stt(self):
+        """STT - emit signals instead of direct callbacks."""
+        self._stt.on_state_changed = self.signals.stt_state_changed.emit
+        self._stt.on_transcription = self.signals.stt_transcription.emit
+        self._stt.on_error = self.signals.stt_error.emit
+
+    def _set_groq_api_key(self, api_key: str):
+        """Set Groq API key (applied to STT now or when it is created)."""
+        self._groq_api_key = api_key
+        if self._stt:
+            self._stt.set_api_key(api_key)
 
     def _setup_shortcuts(self):
         """Setup keyboard shortcuts."""
@@ -1068,108 +1190,105 @@ class MainWindow(QMainWindow):
 
     def _load_settings(self):
         """Load settings from file."""
-        self.anthropic_api_key = ""  # Initialize
-
         if CONFIG_FILE.exists():
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    settings = json.load(f)
-                    self.current_language = settings.get('language', 'pl-PL')
-                    self.auto_read_responses = settings.get('auto_read', False)
-
-                    # Load custom skin colors including terminal colors (merge with defaults)
-                    saved_skin = settings.get('skin_colors', {})
-                    for key in DEFAULT_SKIN_COLORS:
-                        if key in saved_skin:
-                            self.skin_colors[key] = saved_skin[key]
-
-                    # Load custom skin icons (merge with defaults)
-                    saved_icons = settings.get('skin_icons', {})
-                    for key in DEFAULT_SKIN_ICONS:
-                        if key in saved_icons:
-                            self.skin_icons[key] = saved_icons[key]
-
-                    # Set STT language
-                    lang_code = self.current_language.split('-')[0]
-                    self.stt.set_language(lang_code)
-
-                    # Set TTS voice
-                    if self.current_language in SUPPORTED_LANGUAGES:
-                        voice = SUPPORTED_LANGUAGES[self.current_language][2]
-                        self.tts.set_voice(voice)
-
-                    # Set Groq API key
-                    api_key = settings.get('groq_api_key', GROQ_API_KEY)
-                    self.stt.set_api_key(api_key)
-
-                    # Set Anthropic API key
-                    self.anthropic_api_key = settings.get('anthropic_api_key', '')
-
-                    # Load Claude command settings
-                    self.claude_command = settings.get('claude_command', '/usr/bin/claude')
-                    self.auto_run_claude = settings.get('auto_run_claude', True)
-
-                    # Load last session tokens (popup removed)
-                    last_tokens = settings.get('last_session_tokens', 0)
+                settings = json.loads(CONFIG_FILE.read_bytes())
+                self.current_language = settings.get('language', 'pl-PL')
+                self.auto_read_responses = settings.get('auto_read', False)
+
+                # Load custom skin colors including terminal colors (merge with defaults)
+                saved_skin = settings.get('skin_colors', {})
+                for key in DEFAULT_SKIN_COLORS:
+                    if key in saved_skin:
+                        self.skin_colors[key] = saved_skin[key]
+
+                # Load custom skin icons (merge with defaults)
+                saved_icons = settings.get('skin_icons', {})
+                for key in DEFAULT_SKIN_ICONS:
+                    if key in saved_icons:
+                        self.skin_icons[key] = saved_icons[key]
+
+                # STT language / TTS voice follow current_language when
+                # the engines are created
+
+                # Set Groq API key
+                api_key = settings.get('groq_api_key', GROQ_API_KEY)
+                self._set_groq_api_key(api_key)
+
+                # Set Anthropic API key
+                self.anthropic_api_key = settings.get('anthropic_api_key', '')
+
+                # Load Claude command settings
+                self.claude_command = settings.get('claude_command', '/usr/bin/claude')
+                self.auto_run_claude = settings.get('auto_run_claude', True)
+
+                # Load last session tokens (popup removed)
+                last_tokens = settings.get('last_session_tokens', 0)
 
             except Exception as e:
                 print(f"Error loading settings: {e}")
 
     def _save_settings(self):
-        """Save settings to file."""
+        """Schedule a settings save (debounced, written off the GUI thread)."""
+        self._settings_dirty = True
+        self._settings_save_timer.start()
+
+    def _flush_settings(self, blocking: bool = False):
+        """Write pending settings to file."""
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+
         settings = {
             'language': self.current_language,
             'auto_read': self.auto_read_responses,
-            'groq_api_key': self.stt.api_key,
-            'anthropic_api_key': getattr(self, 'anthropic_api_key', ''),
+            'groq_api_key': self._groq_api_key,
+            'anthropic_api_key': self.anthropic_api_key,
             'skin_colors': self.skin_colors,  # Zawiera kolory interfejsu + terminala
             'skin_icons': self.skin_icons,    # Zawiera ikony przycisków
             'last_session_tokens': self._total_context_tokens,
             'claude_command': self.claude_command,
             'auto_run_claude': self.auto_run_claude,
         }
-        try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(settings, f, indent=2)
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+        data = _dumps(settings)
+        if blocking:
+            _write_config_file(CONFIG_FILE, data, "settings")
+        else:
+            self._io_pool.start(_ConfigWriteTask(CONFIG_FILE, data, "settings"))
 
     def _load_quick_actions(self) -> list:
         """Load quick actions from file."""
         if QUICK_ACTIONS_FILE.exists():
             try:
-                with open(QUICK_ACTIONS_FILE, 'r') as f:
-                    return json.load(f)
+                return json.loads(QUICK_ACTIONS_FILE.read_bytes())
             except:
                 pass
         return DEFAULT_QUICK_ACTIONS.copy()
 
     def _save_quick_actions(self):
         """Save quick actions to file."""
-        try:
-            with open(QUICK_ACTIONS_FILE, 'w') as f:
-                json.dump(self.quick_actions, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving quick actions: {e}")
+        data = _dumps(self.quick_actions)
+        self._io_pool.start(_ConfigWriteTask(QUICK_ACTIONS_FILE, data, "quick actions"))
 
     def _update_quick_actions_menu(self):
         """Update quick actions dropdown menu in all tabs."""
         for agent_id, tab in self.agent_tabs.items():
             if hasattr(tab, 'quick_actions_btn'):
-                menu = QMenu(tab.quick_actions_btn)
+                # Reuse the tab's menu; clear() deletes the actions it owns
+                menu = tab.quick_actions_btn.menu()
+                if menu is None:
+                    menu = QMenu(tab.quick_actions_btn)
+                    tab.quick_actions_btn.setMenu(menu)
+                menu.clear()
 
                 for action in self.quick_actions:
-                    item = QAction(action['label'], self)
-                    item.triggered.connect(lambda checked, cmd=action['command']: self._insert_quick_action(cmd))
-                    menu.addAction(item)
+                    item = menu.addAction(action['label'])
+                    item.triggered.connect(partial(self._insert_quick_action, action['command']))
 
                 menu.addSeparator()
 
-                add_action = QAction("➕ Dodaj własną...", self)
+                add_action = menu.addAction("➕ Dodaj własną...")
                 add_action.triggered.connect(self._add_quick_action)
-                menu.addAction(add_action)
-
-                tab.quick_actions_btn.setMenu(menu)
 
     def _check_license(self):
         """Check license status (silent - no popups)."""
@@ -1179,15 +1298,21 @@ class MainWindow(QMainWindow):
 
     def _start_claude(self):
         """Start Claude Code process (legacy - not used with QTermWidget)."""
-        self._update_status("Uruchamianie Claude Code...")
-        self._append_system_message("Uruchamianie Claude Code...")
+        # Status bar + conversation updates land in one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_status("Uruchamianie Claude Code...")
+            self._append_system_message("Uruchamianie Claude Code...")
 
-        if self.claude.start():
-            self._update_status("Claude Code uruchomiony")
-            self._append_system_message("Claude Code gotowy. Możesz pisać lub dyktować polecenia.")
-        else:
-            self._update_status("Błąd uruchamiania Claude Code")
-            self._append_system_message("Błąd: Nie można uruchomić Claude Code. Upewnij się, że jest zainstalowany.")
+            if self.claude.start():
+                self._update_status("Claude Code uruchomiony")
+                self._append_system_message("Claude Code gotowy. Możesz pisać lub dyktować polecenia.")
+            else:
+                self._update_status("Błąd uruchamiania Claude Code")
+                self._append_system_message("Błąd: Nie można uruchomić Claude Code. Upewnij się, że jest zainstalowany.")
+        finally:
+            # Re-enabling schedules a single update of the whole window
+            self.setUpdatesEnabled(True)
 
     def _auto_run_claude_command(self):
         """Auto-run Claude command in all terminals with auto_start enabled.
@@ -1232,22 +1357,27 @@ class MainWindow(QMainWindow):
         if self._scroll_manager:
             self._scroll_manager.schedule_scroll()
 
-    def _set_language(self, lang_code: str):
+    def _set_language(self, lang_code: str, checked: bool = False):
         """Handle language change from menu."""
         self.current_language = lang_code
 
-        # Update checkmarks in menu
-        for code, action in self.language_actions.items():
-            action.setChecked(code == lang_code)
+        # Update checkmarks in menu - only the previous and new entries change
+        if self._current_lang_action is not None:
+            self._current_lang_action.setChecked(False)
+        action = self.language_actions.get(lang_code)
+        if action is not None:
+            action.setChecked(True)
+        self._current_lang_action = action
 
         # Update TTS voice
-        if self.current_language in SUPPORTED_LANGUAGES:
-            voice = SUPPORTED_LANGUAGES[self.current_language][2]
-            self.tts.set_voice(voice)
+        voice = LANG_TO_VOICE.get(self.current_language)
+        if voice and self._tts:
+            self._tts.set_voice(voice)
 
         # Update STT language
         lang_prefix = self.current_language.split('-')[0]
-        self.stt.set_language(lang_prefix)
+        if self._stt:
+            self._stt.set_language(lang_prefix)
 
         # Update UI language
         self._update_ui_language()
@@ -1256,40 +1386,40 @@ class MainWindow(QMainWindow):
 
     def _get_text(self, key: str) -> str:
         """Get translated text for current language."""
-        # Try current language
-        if self.current_language in UI_TRANSLATIONS:
-            if key in UI_TRANSLATIONS[self.current_language]:
-                return UI_TRANSLATIONS[self.current_language][key]
-        # Fallback to English
-        if "en-US" in UI_TRANSLATIONS and key in UI_TRANSLATIONS["en-US"]:
-            return UI_TRANSLATIONS["en-US"][key]
-        # Fallback to Polish
-        if "pl-PL" in UI_TRANSLATIONS and key in UI_TRANSLATIONS["pl-PL"]:
-            return UI_TRANSLATIONS["pl-PL"][key]
-        return key
+        return tr(self.current_language, key)
 
     def _update_ui_language(self):
         """Update all UI elements to current language."""
-        # Update tooltips in current tab
-        tab = self._get_current_agent_tab()
-        if tab:
-            # Buttons are icon-only, update only tooltips
-            tab.dictate_btn.setToolTip(self._get_text('dictate'))
-            tab.read_btn.setToolTip(self._get_text('read'))
-            tab.copy_btn.setToolTip(self._get_text('copy'))
-            tab.clear_input_btn.setToolTip(self._get_text('clear_input'))
-            tab.add_media_btn.setToolTip(self._get_text('add_media'))
-            tab.pause_btn.setToolTip(self._get_text('pause'))
-            tab.stop_btn.setToolTip(self._get_text('stop'))
-            tab.send_btn.setToolTip(self._get_text('send'))
-            tab.auto_read_checkbox.setText(self._get_text('auto_read'))
-
-            # Update input placeholder
-            placeholder = "Type a command or use dictation..." if self.current_language.startswith("en") else "Wpisz polecenie lub użyj dyktowania..."
-            tab.input_field.setPlaceholderText(placeholder)
-
-        # Update window title
-        self.setWindowTitle(f"{self._get_text('app_title')} v{APP_VERSION}")
+        # Apply all text changes, then repaint once
+        self.setUpdatesEnabled(False)
+        try:
+            labels = _ui_labels(self.current_language)
+
+            # Update tooltips in current tab
+            tab = self._get_current_agent_tab()
+            if tab:
+                # Buttons are icon-only, update only tooltips (no repaint involved)
+                tab.dictate_btn.setToolTip(labels['dictate'])
+                tab.read_btn.setToolTip(labels['read'])
+                tab.copy_btn.setToolTip(labels['copy'])
+                tab.clear_input_btn.setToolTip(labels['clear_input'])
+                tab.add_media_btn.setToolTip(labels['add_media'])
+                tab.pause_btn.setToolTip(labels['pause'])
+                tab.stop_btn.setToolTip(labels['stop'])
+                tab.send_btn.setToolTip(labels['send'])
+
+                # Visible texts - skip no-op sets, they still repaint
+                checkbox = tab.auto_read_checkbox
+                _set_if_changed(checkbox.text, checkbox.setText, labels['auto_read'])
+
+                # Update input placeholder
+                field = tab.input_field
+                _set_if_changed(field.placeholderText, field.setPlaceholderText, labels['placeholder'])
+
+            # Update window title
+            _set_if_changed(self.windowTitle, self.setWindowTitle, labels['title'])
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _on_auto_read_changed(self, state: int):
         """Handle auto-read checkbox change."""
@@ -1297,26 +1427,42 @@ class MainWindow(QMainWindow):
         self._save_settings()
 
     def _on_claude_output(self, text: str):
-        """Handle real-time output from Claude."""
+        """Handle real-time output from Claude - buffered, see _flush_claude_buf."""
         if text and text.strip():
-            cursor = self.conversation_area.textCursor()
-            cursor.movePosition(QTextCursor.End)
-
             # Check if it's processing indicator
-            if "Processing" in text or "⏳" in text:
-                # Purple color for processing
-                fmt = QTextCharFormat()
-                fmt.setForeground(QColor("#a78bfa"))
-                cursor.insertText("⏳ Processing...\n", fmt)
+            self._claude_buf.append(("Processing" in text or "⏳" in text, text))
+            if not self._claude_flush_timer.isActive():
+                self._claude_flush_timer.start(30)
+
+    def _flush_claude_buf(self):
+        """Insert buffered Claude output, one insertText per same-format run."""
+        # Also called directly to drain the buffer before other writes
+        self._claude_flush_timer.stop()
+        chunks = self._claude_buf
+        self._claude_buf = []
+        if not chunks or not self.conversation_area:
+            return
+
+        # Merge consecutive chunks of the same kind
+        runs = []
+        for is_processing, text in chunks:
+            piece = "⏳ Processing...\n" if is_processing else text
+            if runs and runs[-1][0] == is_processing:
+                runs[-1][1].append(piece)
             else:
-                # White color for AI response
-                fmt = QTextCharFormat()
-                fmt.setForeground(QColor("#e4e4e7"))
-                cursor.insertText(text, fmt)
+                runs.append((is_processing, [piece]))
 
-            self.conversation_area.setTextCursor(cursor)
-            self.conversation_area.ensureCursorVisible()
-            QApplication.processEvents()
+        cursor = self.conversation_area.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for is_processing, pieces in runs:
+            # Purple for processing, white for AI response
+            fmt = self._fmt_processing if is_processing else self._fmt_ai
+            cursor.insertText("".join(pieces), fmt)
+        cursor.endEditBlock()
+
+        self.conversation_area.setTextCursor(cursor)
+        self.conversation_area.ensureCursorVisible()
 
     def _on_claude_response(self, text: str):
         """Handle complete response from Claude."""
@@ -1332,28 +1478,22 @@ class MainWindow(QMainWindow):
 
     def _on_terminal_output(self, data):
         """Handle data received from terminal (for TTS and token counting)."""
-        # Decode bytes to string
-        try:
-            text = data.data().decode('utf-8', errors='ignore')
-        except:
-            text = str(data)
-
-        # Filter out ANSI escape codes for TTS
-        import re
-        clean_text = re.sub(r'\x1b\[[0-9;]*[a-zA-Z]', '', text)
-        clean_text = re.sub(r'\x1b\][^\x07]*\x07', '', clean_text)  # OSC sequences
-        clean_text = clean_text.strip()
+        # AgentTab emits batched output with ANSI codes already stripped,
+        # and only when the batch has text
+        clean = bytes(data)
 
-        if clean_text:
-            # Add to buffer with newline separator
-            self._terminal_output_buffer += clean_text + "\n"
+        if clean:
+            # Add to buffer with newline separator (in place, no str copies)
+            buf = self._terminal_output_buffer
+            buf += clean
+            buf += b"\n"
 
-            # Update context usage counter
-            self._update_context_usage(len(clean_text))
+            # Update context usage counter (counts characters, not bytes)
+            self._update_context_usage(len(clean.decode('utf-8', errors='ignore')))
 
-            # LIMIT buffer size to last 5000 characters to prevent memory issues
-            if len(self._terminal_output_buffer) > 5000:
-                self._terminal_output_buffer = self._terminal_output_buffer[-5000:]
+            # LIMIT buffer size to last 5000 bytes to prevent memory issues
+            if len(buf) > 5000:
+                del buf[:-5000]
 
             # Reset timer - wait 2 seconds after last output before auto-reading
             if self.auto_read_responses:
@@ -1365,11 +1505,12 @@ class MainWindow(QMainWindow):
 
     def _read_terminal_buffer(self):
         """Read accumulated terminal output via TTS (auto-read mode)."""
-        if not self._terminal_output_buffer.strip():
+        buffer_text = self._terminal_output_buffer.decode('utf-8', errors='ignore')
+        if not buffer_text.strip():
             return
 
         # Use the same logic as manual read - extract Claude response only
-        last_response = extract_last_claude_response(self._terminal_output_buffer)
+        last_response = extract_last_claude_response(buffer_text)
 
         if last_response:
             # Fix Polish encoding first
@@ -1384,7 +1525,7 @@ class MainWindow(QMainWindow):
                 self._update_status("Auto-czytam odpowiedź...")
 
         # Always clear buffer after auto-read attempt
-        self._terminal_output_buffer = ""
+        del self._terminal_output_buffer[:]
 
     def _on_terminal_finished(self):
         """Handle terminal session finished."""
@@ -1396,8 +1537,10 @@ class MainWindow(QMainWindow):
             if self._scroll_manager:
                 QTimer.singleShot(500, self._scroll_manager.schedule_scroll)
 
-    def _on_tts_state_changed(self, state: TTSState):
+    def _on_tts_state_changed(self, state: 'TTSState'):
         """Handle TTS state change."""
+        from core.tts_engine import TTSState
+
         tab = self._get_current_agent_tab()
         if not tab:
             return
@@ -1454,8 +1597,10 @@ class MainWindow(QMainWindow):
         tab.read_btn.setText(self._get_icon('read', 'normal'))
         self._update_status("Gotowy")
 
-    def _on_stt_state_changed(self, state: STTState):
+    def _on_stt_state_changed(self, state: 'STTState'):
         """Handle STT state change."""
+        from core.stt_engine import STTState
+
         tab = self._get_current_agent_tab()
         if not tab:
             return
@@ -1693,21 +1838,24 @@ class MainWindow(QMainWindow):
                     self._update_status("Zaznaczony tekst nie zawiera treści do odczytania")
                 return
 
+            buffer_text = self._terminal_output_buffer.decode('utf-8', errors='ignore')
+
             # DEBUG: Save buffer to file for analysis
-            debug_file = Path.home() / ".claude-voice-assistant" / "debug_buffer.txt"
+            debug_file = HOME_DIR / ".claude-voice-assistant" / "debug_buffer.txt"
             try:
+                ensure_config_dir()
                 with open(debug_file, 'w') as f:
                     f.write("=== RAW BUFFER ===\n")
-                    f.write(self._terminal_output_buffer)
+                    f.write(buffer_text)
                     f.write("\n\n=== BUFFER LENGTH ===\n")
-                    f.write(str(len(self._terminal_output_buffer)))
+                    f.write(str(len(buffer_text)))
             except:
                 pass
 
             # No selection - extract last Claude response from buffer
-            if self._terminal_output_buffer.strip():
+            if buffer_text.strip():
                 # Extract only the last response
-                last_response = extract_last_claude_response(self._terminal_output_buffer)
+                last_response = extract_last_claude_response(buffer_text)
 
                 # DEBUG: Save extracted response
                 try:
@@ -1739,23 +1887,26 @@ class MainWindow(QMainWindow):
                         self.tts.speak(cleaned_text)
                         self._update_status("Czytam ostatnią odpowiedź...")
                         # Clear buffer after reading
-                        self._terminal_output_buffer = ""
+                        del self._terminal_output_buffer[:]
                     else:
                         self._update_status("Odpowiedź nie zawiera treści do odczytania")
                 else:
                     self._update_status("Nie znaleziono odpowiedzi do odczytania")
                     # Clear buffer anyway to prevent accumulation
-                    self._terminal_output_buffer = ""
+                    del self._terminal_output_buffer[:]
             else:
                 self._update_status("Brak tekstu do odczytania")
             return
 
-        # Fallback for QTextEdit mode
+        # Fallback for QPlainTextEdit mode
         if not self.conversation_area:
             return
 
-        text = self.conversation_area.toPlainText()
-        if not text:
+        text = self._fallback_response_text()
+
+        # Drop [System] / processing lines in one pass
+        text = _SYS_LINE_RE.sub('', text)
+        if not text.strip():
             return
 
         # Extract last response
@@ -1772,6 +1923,33 @@ class MainWindow(QMainWindow):
         else:
             self._update_status("Nie znaleziono odpowiedzi do odczytania")
 
+    def _fallback_response_text(self) -> str:
+        """Conversation text since the last user prompt (QPlainTextEdit fallback view)."""
+        # Make sure the still-buffered tail of the response is in the document
+        self._flush_claude_buf()
+
+        doc = self.conversation_area.document()
+
+        # Only the text since the last user message - no full-document copy
+        marker = self._last_user_msg_cursor
+        if marker is not None and marker.document() is doc:
+            tail = QTextCursor(doc)
+            tail.setPosition(marker.position())
+            tail.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
+            return tail.selection().toPlainText()
+
+        # Walk blocks back to the last "> " prompt instead of copying the document
+        lines = []
+        block = doc.lastBlock()
+        while block.isValid():
+            line = block.text()
+            lines.append(line)
+            if line.lstrip().startswith('>'):
+                break
+            block = block.previous()
+        lines.reverse()
+        return "\n".join(lines)
+
     def _copy_selection(self):
         """Copy selected text from terminal to system clipboard."""
         if self.terminal and QTERMWIDGET_AVAILABLE:
@@ -1787,7 +1965,7 @@ class MainWindow(QMainWindow):
             else:
                 self._update_status("Najpierw zaznacz tekst w terminalu")
         else:
-            # Fallback for QTextEdit mode
+            # Fallback for QPlainTextEdit mode
             if self.conversation_area:
                 cursor = self.conversation_area.textCursor()
                 selected = cursor.selectedText()
@@ -1951,24 +2129,27 @@ class MainWindow(QMainWindow):
 
     def _toggle_pause(self):
         """Toggle TTS pause/resume."""
-        self.tts.toggle_pause()
+        if self._tts:
+            self._tts.toggle_pause()
 
     def _stop_all(self):
         """Stop all operations."""
-        self.tts.stop()
-        self.stt.cancel_recording()
+        if self._tts:
+            self._tts.stop()
+        if self._stt:
+            self._stt.cancel_recording()
 
         if self.terminal and QTERMWIDGET_AVAILABLE:
             # Send Ctrl+C to terminal
             self.terminal.sendText("\x03")  # Ctrl+C
-            self._terminal_output_buffer = ""
+            del self._terminal_output_buffer[:]
             self._tts_timer.stop()
         else:
             self.claude.send_interrupt()
 
         self._update_status("Zatrzymano")
 
-    def _insert_quick_action(self, command: str):
+    def _insert_quick_action(self, command: str, checked: bool = False):
         """Insert quick action command."""
         self.input_field.setText(command)
         self.input_field.setFocus()
@@ -2053,7 +2234,7 @@ class MainWindow(QMainWindow):
             if self.terminal and QTERMWIDGET_AVAILABLE:
                 # Clear terminal and restart shell
                 self.terminal.sendText("clear\n")
-                self._terminal_output_buffer = ""
+                del self._terminal_output_buffer[:]
                 # Licznik tokenów NIE jest resetowany - liczy do końca sesji
             else:
                 self.conversation_area.clear()
@@ -2063,10 +2244,10 @@ class MainWindow(QMainWindow):
 
     def _show_settings(self):
         """Show settings dialog."""
-        dialog = SettingsDialog(self, self.stt.api_key)
+        dialog = SettingsDialog(self, self._groq_api_key)
         if dialog.exec_() == QDialog.Accepted:
             api_key = dialog.get_api_key()
-            self.stt.set_api_key(api_key)
+            self._set_groq_api_key(api_key)
             self._save_settings()
 
     def _show_about(self):
@@ -2353,14 +2534,16 @@ Color={hex_to_rgb(colors.get('terminal_color_7', '#D3D7CF'))}
 Color={hex_to_rgb(colors.get('terminal_color_7_bright', '#EEEEEC'))}
 """
 
-        # Create custom color scheme directory and file
-        import os
-        custom_scheme_dir = Path.home() / '.config' / 'claude-voice-assistant' / 'color-schemes'
-        custom_scheme_dir.mkdir(parents=True, exist_ok=True)
+        # Create custom color scheme directory and file - only when the
+        # scheme changed (this runs per new tab and several times at startup)
+        custom_scheme_dir = HOME_DIR / '.config' / 'claude-voice-assistant' / 'color-schemes'
+        if scheme_content != self._terminal_scheme_content:
+            custom_scheme_dir.mkdir(parents=True, exist_ok=True)
 
-        scheme_file = custom_scheme_dir / 'CustomSkin.colorscheme'
-        with open(scheme_file, 'w') as f:
-            f.write(scheme_content)
+            scheme_file = custom_scheme_dir / 'CustomSkin.colorscheme'
+            with open(scheme_file, 'w') as f:
+                f.write(scheme_content)
+            self._terminal_scheme_content = scheme_content
 
         # Apply scheme to specific terminal or all terminals in all tabs
         scheme_name = 'CustomSkin'
@@ -2493,47 +2676,40 @@ Color={hex_to_rgb(colors.get('terminal_color_7_bright', '#EEEEEC'))}
                 border-radius: 5px;
                 padding: 6px;
             }}
+            QTabWidget#agentTabs::pane {{
+                border: none;
+                background-color: transparent;
+            }}
+            QTabWidget#agentTabs QTabBar::tab {{
+                background-color: {colors.get('button_bg', '#2d0a1e')};
+                color: {colors.get('text_color', '#ffffff')};
+                padding: 8px 16px;
+                margin-right: 2px;
+                border-top-left-radius: 6px;
+                border-top-right-radius: 6px;
+            }}
+            QTabWidget#agentTabs QTabBar::tab:selected {{
+                background-color: {colors.get('hover_color', '#4a1a3a')};
+            }}
+            QTabWidget#agentTabs QTabBar::tab:hover {{
+                background-color: {colors.get('hover_color', '#6a2a5a')};
+            }}
         """)
 
         # Apply styles to all agent tabs
         for agent_tab in self.agent_tabs.values():
             agent_tab.apply_styles(colors, self.skin_icons)
 
-        # Tab widget styling
-        if hasattr(self, 'tab_widget'):
-            self.tab_widget.setStyleSheet(f"""
-                QTabWidget::pane {{
-                    border: none;
-                    background-color: transparent;
-                }}
-                QTabBar::tab {{
-                    background-color: {colors.get('button_bg', '#2d0a1e')};
-                    color: {colors.get('text_color', '#ffffff')};
-                    padding: 8px 16px;
-                    margin-right: 2px;
-                    border-top-left-radius: 6px;
-                    border-top-right-radius: 6px;
-                }}
-                QTabBar::tab:selected {{
-                    background-color: {colors.get('hover_color', '#4a1a3a')};
-                }}
-                QTabBar::tab:hover {{
-                    background-color: {colors.get('hover_color', '#6a2a5a')};
-                }}
-            """)
 
         # Button icon styles (transparent with colored icons)
         self._apply_button_icon_styles()
 
-        # Store inactive panel color for changeEvent
-        self._inactive_panel_bg = colors['inactive_panel_bg']
-
         # Apply terminal colors to all tabs
         self._apply_terminal_colors(colors)
 
     def _show_groq_api_dialog(self):
         """Show dialog to enter Groq API key."""
-        current_key = self.stt.api_key or ""
+        current_key = self._groq_api_key or ""
         # Show masked key if exists
         display_key = current_key[:8] + "..." if len(current_key) > 8 else current_key
 
@@ -2542,14 +2718,14 @@ Color={hex_to_rgb(colors.get('terminal_color_7_bright', '#EEEEEC'))}
             QLineEdit.Normal)
 
         if ok and key:
-            self.stt.set_api_key(key)
+            self._set_groq_api_key(key)
             self._save_settings()
             QMessageBox.information(self, "Zapisano",
                 "Klucz API Groq został zapisany.")
 
     def _show_anthropic_api_dialog(self):
         """Show dialog to enter Anthropic API key."""
-        current_key = getattr(self, 'anthropic_api_key', "") or ""
+        current_key = self.anthropic_api_key or ""
         # Show masked key if exists
         display_key = current_key[:8] + "..." if len(current_key) > 8 else current_key
 
@@ -2673,17 +2849,24 @@ Color={hex_to_rgb(colors.get('terminal_color_7_bright', '#EEEEEC'))}
         if not self.conversation_area:
             return  # Using QTermWidget - no need to append
 
+        # Pending Claude output belongs above the new prompt
+        self._flush_claude_buf()
+
         cursor = self.conversation_area.textCursor()
         cursor.movePosition(QTextCursor.End)
 
-        # Yellow/orange color for user prompt - like terminal
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor("#f59e0b"))
-        fmt.setFontWeight(QFont.Bold)
+        # Remember where this message starts for _read_last_response. Keep the
+        # position on insert - otherwise the marker rides along with every
+        # append made at the end of the document.
+        marker = QTextCursor(self.conversation_area.document())
+        marker.setPosition(cursor.position())
+        marker.setKeepPositionOnInsert(True)
+        self._last_user_msg_cursor = marker
 
-        cursor.insertText("\n", QTextCharFormat())
-        cursor.insertText(f"> {text}", fmt)
-        cursor.insertText("\n", QTextCharFormat())
+        # Yellow/orange color for user prompt - like terminal
+        cursor.insertText("\n", self._fmt_plain)
+        cursor.insertText(f"> {text}", self._fmt_user)
+        cursor.insertText("\n", self._fmt_plain)
 
         self.conversation_area.setTextCursor(cursor)
 
@@ -2694,16 +2877,19 @@ Color={hex_to_rgb(colors.get('terminal_color_7_bright', '#EEEEEC'))}
             self._update_status(text)
             return
 
+        # Pending Claude output belongs above the system message
+        self._flush_claude_buf()
+
         cursor = self.conversation_area.textCursor()
         cursor.movePosition(QTextCursor.End)
 
         # Cyan color for system messages
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor("#22d3ee"))
-
-        cursor.insertText("\n", QTextCharFormat())
-        cursor.insertText(f"[System] {text}", fmt)
-        cursor.insertText("\n", QTextCharFormat())
+        # One edit block = one document change / relayout for the three inserts
+        cursor.beginEditBlock()
+        cursor.insertText("\n", self._fmt_plain)
+        cursor.insertText(f"[System] {text}", self._fmt_system)
+        cursor.insertText("\n", self._fmt_plain)
+        cursor.endEditBlock()
 
         self.conversation_area.setTextCursor(cursor)
 
@@ -2775,8 +2961,10 @@ Color={hex_to_rgb(colors.get('terminal_color_7_bright', '#EEEEEC'))}
         if hasattr(self, '_scroll_manager') and self._scroll_manager:
             self._scroll_manager.stop()
 
-        self.tts.stop()
-        self.stt.cancel_recording()
+        if self._tts:
+            self._tts.shutdown()
+        if self._stt:
+            self._stt.shutdown()
 
         if self.terminal and QTERMWIDGET_AVAILABLE:
             # Terminal cleanup
@@ -2785,31 +2973,19 @@ Color={hex_to_rgb(colors.get('terminal_color_7_bright', '#EEEEEC'))}
         else:
             self.claude.stop()
 
-        self._save_settings()
+        # Finish queued writes, then save settings synchronously
+        self._settings_save_timer.stop()
+        self._io_pool.waitForDone()
+        self._settings_dirty = True
+        self._flush_settings(blocking=True)
         event.accept()
 
     def changeEvent(self, event):
         """Handle window activation/deactivation - change bottom panel color."""
         if event.type() == QEvent.ActivationChange:
-            if self.isActiveWindow():
-                # Window is active - use custom bottom panel color
-                self.bottom_panel.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: {self.skin_colors['bottom_panel_bg']};
-                        border-radius: 10px;
-                        padding: 5px;
-                    }}
-                """)
-            else:
-                # Window is inactive - use custom inactive color
-                inactive_bg = getattr(self, '_inactive_panel_bg', self.skin_colors.get('inactive_panel_bg', '#3a3a3c'))
-                self.bottom_panel.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: {inactive_bg};
-                        border-radius: 10px;
-                        padding: 5px;
-                    }}
-                """)
+            active = self.isActiveWindow()
+            for tab in self.agent_tabs.values():
+                tab.set_window_active(active)
         super().changeEvent(event)
 
 
@@ -3702,7 +3878,7 @@ lub wczytać skórkę od kogoś innego.</p>
         file_path, _ = styled_get_open_file_name(
             self,
             "Importuj skórkę",
-            str(Path.home()),
+            str(HOME_DIR),
             "Pliki skórki (*.skin.json);;Wszystkie pliki (*)"
         )
         if file_path:
@@ -3744,7 +3920,7 @@ lub wczytać skórkę od kogoś innego.</p>
         file_path, _ = styled_get_save_file_name(
             self,
             "Eksportuj skórkę",
-            str(Path.home() / "moja_skorka.skin.json"),
+            str(HOME_DIR / "moja_skorka.skin.json"),
             "Pliki skórki (*.skin.json);;Wszystkie pliki (*)"
         )
         if file_path:
@@ -0,0 +1 @@
+# UI translation modules (one per locale, loaded on demand by config)
@@ -0,0 +1,31 @@
+"""
+Claude Voice Assistant - UI translations: English (UK) (en-GB)
+"""
+TRANSLATIONS = {
+    "app_title": "Claude Voice Assistant",
+    "dictate": "Dictate",
+    "read": "Read",
+    "copy": "Copy",
+    "clear_input": "Clear input",
+    "add_media": "Add media",
+    "pause": "Pause",
+    "resume": "Resume",
+    "stop": "Stop",
+    "send": "Send",
+    "auto_read": "Auto-read responses",
+    "quick_actions": "Quick Actions",
+    "add_action": "Add custom...",
+    "settings": "Settings",
+    "language": "Language",
+    "voice": "Voice",
+    "speed": "Speed",
+    "recording": "Recording...",
+    "processing": "Processing...",
+    "reading": "Reading...",
+    "paused": "Paused",
+    "trial_days_left": "Trial days left",
+    "buy_license": "Buy licence",
+    "enter_license": "Enter licence key",
+    "license_valid": "Licence active",
+    "license_expired": "Licence expired",
+}
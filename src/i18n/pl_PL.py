@@ -0,0 +1,31 @@
+"""
+Claude Voice Assistant - UI translations: Polish (pl-PL)
+"""
+TRANSLATIONS = {
+    "app_title": "Claude Voice Assistant",
+    "dictate": "Dyktuj",
+    "read": "Czytaj",
+    "copy": "Kopiuj",
+    "clear_input": "Wyczyść pole",
+    "add_media": "Dodaj media",
+    "pause": "Pauza",
+    "resume": "Wznów",
+    "stop": "Stop",
+    "send": "Wyślij",
+    "auto_read": "Auto-czytaj odpowiedzi",
+    "quick_actions": "Szybkie akcje",
+    "add_action": "Dodaj własną...",
+    "settings": "Ustawienia",
+    "language": "Język",
+    "voice": "Głos",
+    "speed": "Szybkość",
+    "recording": "Nagrywanie...",
+    "processing": "Przetwarzanie...",
+    "reading": "Czytam...",
+    "paused": "Wstrzymano",
+    "trial_days_left": "Pozostało dni próbnych",
+    "buy_license": "Kup licencję",
+    "enter_license": "Wprowadź klucz licencji",
+    "license_valid": "Licencja aktywna",
+    "license_expired": "Licencja wygasła",
+}
@@ -12,7 +12,8 @@ os.environ["QT_QPA_PLATFORM"] = "xcb"
 
 # Add src directory to path
 src_dir = Path(__file__).parent
-sys.path.insert(0, str(src_dir))
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
 
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
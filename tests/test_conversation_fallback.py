@@ -0,0 +1,68 @@
+"""
+Fallback (no QTermWidget) conversation view - reading back the last response.
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("PyQt5.QtWidgets")
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QTextCharFormat
+from PyQt5.QtWidgets import QApplication, QPlainTextEdit
+
+from gui.main_window import MainWindow
+
+
+class _Conversation:
+    """Just the MainWindow conversation helpers, on a bare QPlainTextEdit."""
+
+    _append_user_message = MainWindow._append_user_message
+    _on_claude_output = MainWindow._on_claude_output
+    _flush_claude_buf = MainWindow._flush_claude_buf
+    _fallback_response_text = MainWindow._fallback_response_text
+
+    def __init__(self):
+        self.conversation_area = QPlainTextEdit()
+        self._claude_buf = []
+        self._claude_flush_timer = QTimer()
+        self._claude_flush_timer.setSingleShot(True)
+        self._last_user_msg_cursor = None
+        self._fmt_plain = QTextCharFormat()
+        self._fmt_user = QTextCharFormat()
+        self._fmt_ai = QTextCharFormat()
+        self._fmt_processing = QTextCharFormat()
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_last_response_text_after_user_message(app):
+    conv = _Conversation()
+    conv._append_user_message("pierwsze pytanie")
+    conv._on_claude_output("stara odpowiedź\n")
+    conv._append_user_message("jak się masz?")
+    conv._on_claude_output("Dziękuję, ")
+    conv._on_claude_output("wszystko dobrze.\n")
+
+    # Output still buffered - reading must flush it first
+    text = conv._fallback_response_text()
+
+    assert text.strip()
+    assert "> jak się masz?" in text
+    assert "Dziękuję, wszystko dobrze." in text
+    assert "stara odpowiedź" not in text
+
+
+def test_last_response_text_without_marker(app):
+    conv = _Conversation()
+    conv.conversation_area.setPlainText("> pytanie\nodpowiedź")
+
+    assert conv._fallback_response_text() == "> pytanie\nodpowiedź"
@@ -0,0 +1,45 @@
+"""
+License manager - server revalidation failure handling.
+"""
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+requests = pytest.importorskip("requests")
+
+from core.license_manager import LicenseManager, LicenseStatus
+
+
+def _manager(tmp_path, response):
+    manager = LicenseManager(config_dir=tmp_path)
+    manager._license_data = {'license_type': 'pro', 'license_key': 'KEY'}
+    session = mock.Mock()
+    session.post.return_value = response
+    manager._get_session = lambda: session
+    return manager
+
+
+def test_validate_with_invalid_json_body_is_offline(tmp_path):
+    response = mock.Mock(status_code=200)
+    response.json.side_effect = requests.JSONDecodeError("Expecting value", "<html>", 0)
+    manager = _manager(tmp_path, response)
+
+    assert manager.validate() == LicenseStatus.OFFLINE
+    # Counted as a failure, so the next attempt backs off
+    assert manager._consecutive_failures == 1
+    assert manager._next_retry_at is not None
+    assert manager.can_use_app()
+
+
+def test_validate_with_unwritable_license_file_is_offline(tmp_path):
+    response = mock.Mock(status_code=200)
+    response.json.return_value = {'valid': True, 'expiry_date': None}
+    manager = _manager(tmp_path, response)
+
+    with mock.patch.object(manager, '_save_license', side_effect=OSError("read-only")):
+        assert manager.validate() == LicenseStatus.OFFLINE
+    assert manager._next_retry_at is not None